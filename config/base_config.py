@@ -60,6 +60,17 @@ ENABLE_GET_SUB_COMMENTS = False
 # 如果视频评论数量很大，可以设置此值来限制爬取数量
 PER_NOTE_MAX_COMMENTS_COUNT = 0
 
+# 单页一级评论下并发获取二级评论的最大数量
+# ⚠️ 请勿设置过大，仅在开启二级评论时生效
+# 该并发数作用于每个视频：实际同时请求二级评论的数量约为 MAX_CONCURRENCY_NUM × MAX_SUB_COMMENT_CONCURRENCY，
+# 且每条回复链各自按 CRAWLER_TIME_SLEEP 间隔请求，整体请求频率同样按此倍数放大
+MAX_SUB_COMMENT_CONCURRENCY = 1
+
+# ==================== 数据提取配置 ====================
+# 是否在线程池中批量提取视频数据，默认不开启
+# 单条提取耗时较长（>1ms）时开启，可避免提取阻塞事件循环中的其他请求
+ENABLE_EXTRACT_IN_THREAD = False
+
 # ==================== 日志配置 ====================
 # 是否开启日志打印输出到文件中
 ENABLE_LOG_FILE = True
@@ -73,6 +84,9 @@ ENABLE_CHECKPOINT = True
 SPECIFIED_CHECKPOINT_ID = ""
 
 # 检查点存储类型，支持 file 和 redis
+# 开启评论爬取且并发数较大时推荐使用 redis：每页评论都会写入一次评论游标，
+# redis 的读写为亚毫秒级，可避免多个并发任务在文件读写上排队
+# 使用 redis 时连接信息见 config/db_config.py
 CHECKPOINT_STORAGE_TYPE = "file"  # file or redis
 
 # ==================== 请求控制配置 ====================
@@ -331,9 +331,10 @@ class DouYinApiClient(AbstractApiClient):
     async def cleanup(self):
         """
         清理资源
-        关闭HTTP客户端连接
+        关闭HTTP客户端连接和签名线程池
         """
         await self._reset_http_client()
+        self._sign_logic.close()
 
     @retry(stop=stop_after_attempt(5), wait=wait_fixed(1))
     async def request(self, method, url, **kwargs) -> Union[Response, Dict]:
@@ -14,8 +14,10 @@ import constant
 from base.base_crawler import AbstractCrawler
 from constant.douyin import DOUYIN_FIXED_USER_AGENT
 from pkg.account_pool.pool import AccountWithIpPoolManager
+from pkg.async_http_client import AsyncHTTPClient
 from pkg.proxy.proxy_ip_pool import ProxyIpPool, create_ip_pool
 from pkg.tools import utils
+from repo.platform_save_data import douyin as douyin_store
 from var import crawler_type_var
 
 from .client import DouYinApiClient
@@ -201,4 +203,9 @@ class DouYinCrawler(AbstractCrawler):
         """
         if self.dy_client:
             await self.dy_client.cleanup()
+            account_with_ip_pool = self.dy_client.account_with_ip_pool
+            if account_with_ip_pool and account_with_ip_pool.proxy_ip_pool:
+                await account_with_ip_pool.proxy_ip_pool.close()
+        await AsyncHTTPClient.close_shared()
+        await douyin_store.close_store()
         utils.logger.info("[DouYinCrawler.cleanup] Resources cleaned up")
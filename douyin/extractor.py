@@ -4,12 +4,28 @@
 从API响应中提取和转换数据，将原始JSON数据转换为数据模型对象
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from model.m_douyin import DouyinAweme, DouyinAwemeComment, DouyinCreator
 from var import source_keyword_var
 
 
+def _to_int(value: Any) -> int:
+    """
+    在数据入口处将计数字段统一转换为整数
+    
+    Args:
+        value: API返回的计数值，可能为整数、数字字符串或空值
+        
+    Returns:
+        int: 转换后的整数，无法转换时返回0
+    """
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
 class DouyinExtractor:
     """
     抖音数据提取器
@@ -105,34 +121,35 @@ class DouyinExtractor:
         cover_url = self._extract_content_cover_url(aweme_info)
 
         # 构建视频模型对象
-        return DouyinAweme(
+        # 所有字段已在此处规整为目标类型，使用 model_construct 跳过逐字段校验
+        return DouyinAweme.model_construct(
             aweme_id=str(aweme_info.get("aweme_id", "")),
             aweme_type=str(aweme_info.get("aweme_type", "")),
-            title=aweme_info.get("preview_title", "") or aweme_info.get("desc", ""),
-            desc=aweme_info.get("desc", ""),
+            title=aweme_info.get("preview_title", "") or aweme_info.get("desc", "") or "",
+            desc=aweme_info.get("desc", "") or "",
             create_time=str(aweme_info.get("create_time", "")),
-            liked_count=str(statistics.get("digg_count", "")),
-            comment_count=str(statistics.get("comment_count", "")),
-            share_count=str(statistics.get("share_count", "")),
-            collected_count=str(statistics.get("collect_count", "")),
+            liked_count=_to_int(statistics.get("digg_count")),
+            comment_count=_to_int(statistics.get("comment_count")),
+            share_count=_to_int(statistics.get("share_count")),
+            collected_count=_to_int(statistics.get("collect_count")),
             aweme_url=f"https://www.douyin.com/video/{aweme_info.get('aweme_id', '')}",
             cover_url=cover_url,
             video_download_url=video_download_url,
             source_keyword=source_keyword_var.get(),
-            is_ai_generated=aweme_info.get("aigc_info", {}).get("aigc_label_type", 0),
+            is_ai_generated=int(aweme_info.get("aigc_info", {}).get("aigc_label_type", 0) or 0),
             # 作者信息
             user_id=str(author_info.get("uid", "")),
-            sec_uid=author_info.get("sec_uid", ""),
+            sec_uid=author_info.get("sec_uid", "") or "",
             short_user_id=str(author_info.get("short_id", "")),
-            user_unique_id=author_info.get("unique_id", ""),
-            nickname=author_info.get("nickname", ""),
+            user_unique_id=author_info.get("unique_id", "") or "",
+            nickname=author_info.get("nickname", "") or "",
             avatar=(
                 author_info.get("avatar_thumb", {}).get("url_list", [""])[0]
                 if author_info.get("avatar_thumb")
                 else ""
             ),
-            user_signature=author_info.get("signature", ""),
-            ip_location=aweme_info.get("ip_label", ""),
+            user_signature=author_info.get("signature", "") or "",
+            ip_location=aweme_info.get("ip_label", "") or "",
         )
 
     def extract_comments_from_dict(
@@ -198,29 +215,30 @@ class DouyinExtractor:
         """
         user_info = comment_item.get("user", {})
 
-        return DouyinAwemeComment(
+        # 评论是数量最多的模型，字段已规整为字符串，使用 model_construct 跳过逐字段校验
+        return DouyinAwemeComment.model_construct(
             comment_id=str(comment_item.get("cid", "")),
             aweme_id=str(aweme_id),
-            content=comment_item.get("text", ""),
+            content=comment_item.get("text", "") or "",
             create_time=str(comment_item.get("create_time", "")),
-            sub_comment_count=str(comment_item.get("reply_comment_total", "")),
+            sub_comment_count=_to_int(comment_item.get("reply_comment_total")),
             parent_comment_id=str(comment_item.get("reply_id", "") or ""),
             reply_to_reply_id=str(comment_item.get("reply_to_reply_id", "") or ""),
-            like_count=str(comment_item.get("digg_count", "")),
+            like_count=_to_int(comment_item.get("digg_count")),
             pictures=",".join(self._extract_comment_image_list(comment_item)),
-            ip_location=comment_item.get("ip_label", ""),
+            ip_location=comment_item.get("ip_label", "") or "",
             # 用户信息
             user_id=str(user_info.get("uid", "")),
-            sec_uid=user_info.get("sec_uid", ""),
+            sec_uid=user_info.get("sec_uid", "") or "",
             short_user_id=str(user_info.get("short_id", "")),
-            user_unique_id=user_info.get("unique_id", ""),
-            nickname=user_info.get("nickname", ""),
+            user_unique_id=user_info.get("unique_id", "") or "",
+            nickname=user_info.get("nickname", "") or "",
             avatar=(
                 user_info.get("avatar_thumb", {}).get("url_list", [""])[0]
                 if user_info.get("avatar_thumb")
                 else ""
             ),
-            user_signature=user_info.get("signature", ""),
+            user_signature=user_info.get("signature", "") or "",
         )
 
     def extract_creator_from_dict(self, user_data: Dict) -> Optional[DouyinCreator]:
@@ -7,6 +7,8 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from pkg.tools import utils
+
 if TYPE_CHECKING:
     from ..client import DouYinApiClient
     # from repo.checkpoint.checkpoint_store import CheckpointRepoManager
@@ -45,6 +47,8 @@ class BaseHandler(ABC):
         self.checkpoint_manager = checkpoint_manager
         self.aweme_processor = aweme_processor
         self.comment_processor = comment_processor
+        # 缓存ERROR级别是否启用，异常处理路径据此跳过昂贵的堆栈格式化
+        self._err_enabled = utils.is_log_level_enabled("ERROR")
 
     @abstractmethod
     async def handle(self) -> None:
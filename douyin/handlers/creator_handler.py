@@ -247,8 +247,8 @@ class CreatorHandler(BaseHandler):
                 # 爬虫请求间隔时间
                 await asyncio.sleep(config.CRAWLER_TIME_SLEEP)
 
-            except KeyboardInterrupt:
-                # 用户中断
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                # 用户中断（Ctrl+C 会取消爬虫任务）
                 from pkg.tools.output_formatter import OutputFormatter
                 
                 checkpoint_data = None
@@ -286,17 +286,17 @@ class CreatorHandler(BaseHandler):
                     }
                 )
                 
-                utils.log_error_with_context(
-                    utils.logger,
-                    ex,
-                    context={
-                        "用户ID": sec_user_id,
-                        "当前页码": max_cursor,
-                        "已获取视频数": len(result),
-                        "检查点ID": checkpoint_id if checkpoint_id else "未启用",
-                    }
-                )
-                utils.logger.opt(exception=True).error("完整异常堆栈:")
+                if self._err_enabled:
+                    utils.log_error_with_context(
+                        utils.logger,
+                        ex,
+                        context=lambda: {
+                            "用户ID": sec_user_id,
+                            "当前页码": max_cursor,
+                            "已获取视频数": len(result),
+                            "检查点ID": checkpoint_id if checkpoint_id else "未启用",
+                        }
+                    )
                 break
 
             # 更新checkpoint cursor
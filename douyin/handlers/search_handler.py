@@ -5,12 +5,15 @@
 """
 
 import asyncio
-from typing import Dict, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, List, Tuple, TYPE_CHECKING
 
 import config
 import constant
 from model.m_checkpoint import Checkpoint
+from model.m_douyin import DouyinAweme
 from pkg.tools import utils
+from pkg.tools.output_formatter import OutputFormatter
 from repo.platform_save_data import douyin as douyin_store
 from var import source_keyword_var
 from ..extractor import DouyinExtractor
@@ -24,6 +27,39 @@ if TYPE_CHECKING:
     from ..processors.comment_processor import CommentProcessor
 
 
+@lru_cache(maxsize=1)
+def _parse_keywords(raw: str) -> Tuple[str, ...]:
+    """
+    解析逗号分隔的关键词字符串（关键词在一次运行中不变，结果缓存）
+    
+    Args:
+        raw: 原始关键词配置字符串
+        
+    Returns:
+        Tuple[str, ...]: 去除空白后的关键词元组
+    """
+    return tuple(keyword.strip() for keyword in raw.split(",") if keyword.strip())
+
+
+def _extract_batch(extractor: DouyinExtractor, aweme_info_list: List[Dict]) -> List[DouyinAweme]:
+    """
+    批量提取视频数据（纯同步函数，可放到线程池中执行）
+    
+    Args:
+        extractor: 数据提取器
+        aweme_info_list: 视频原始数据列表
+        
+    Returns:
+        List[DouyinAweme]: 提取成功的视频模型列表
+    """
+    awemes = []
+    for aweme_info in aweme_info_list:
+        aweme = extractor.extract_aweme_from_dict(aweme_info)
+        if aweme:
+            awemes.append(aweme)
+    return awemes
+
+
 class SearchHandler(BaseHandler):
     """
     搜索处理器
@@ -81,7 +117,7 @@ class SearchHandler(BaseHandler):
         if not config.KEYWORDS:
             utils.logger.error("[SearchHandler._get_search_keyword_list] 关键词为空，请配置KEYWORDS")
             return []
-        return [keyword.strip() for keyword in config.KEYWORDS.split(",") if keyword.strip()]
+        return list(_parse_keywords(config.KEYWORDS))
 
     async def search(self) -> None:
         """
@@ -98,8 +134,6 @@ class SearchHandler(BaseHandler):
         if config.CRAWLER_MAX_NOTES_COUNT < dy_limit_count:
             config.CRAWLER_MAX_NOTES_COUNT = dy_limit_count
 
-        from pkg.tools.output_formatter import OutputFormatter
-        
         keyword_list = self._get_search_keyword_list()
         if not keyword_list:
             OutputFormatter.print_error("关键词列表为空，退出")
@@ -163,19 +197,22 @@ class SearchHandler(BaseHandler):
 
                     # 获取search_id用于下一页
                     dy_search_id = posts_res.get("extra", {}).get("logid", "")
-                    aweme_id_list: List[str] = []
 
                     post_item_list: List[Dict] = posts_res.get("data", [])
                     if len(post_item_list) == 0:
                         OutputFormatter.print_warning(f"关键词 {keyword} 没有更多结果")
                         break
 
+                    # 按页大小预分配ID列表，按下标写入，避免逐个append扩容
+                    aweme_id_list: List[str] = [""] * len(post_item_list)
+
                     # 提取视频信息
                     extractor = DouyinExtractor()
+                    aweme_info_list: List[Dict] = []
                     saved_count = 0
                     skipped_count = 0
                     
-                    for post_item in post_item_list:
+                    for i, post_item in enumerate(post_item_list):
                         try:
                             # 提取aweme_info
                             aweme_info: Dict = (
@@ -189,7 +226,7 @@ class SearchHandler(BaseHandler):
                         if not aweme_id:
                             continue
 
-                        aweme_id_list.append(aweme_id)
+                        aweme_id_list[i] = aweme_id
 
                         # 检查是否已经爬取过（断点续爬）
                         if config.ENABLE_CHECKPOINT and self.checkpoint_manager and checkpoint.id:
@@ -200,15 +237,27 @@ class SearchHandler(BaseHandler):
                                 saved_aweme_count += 1
                                 continue
 
-                        # 提取并保存视频数据
-                        aweme = extractor.extract_aweme_from_dict(aweme_info)
-                        if aweme:
-                            await douyin_store.update_douyin_aweme(aweme_item=aweme)
-                            saved_count += 1
-                            saved_aweme_count += 1
-                            # 只显示部分视频ID（避免输出过多）
-                            if saved_count <= 3 or saved_count % 10 == 0:
-                                OutputFormatter.print_video_info(aweme_id, action="已保存")
+                        aweme_info_list.append(aweme_info)
+
+                    # 提取视频数据，整页提取完成后统一保存
+                    # 开启后放到线程池执行，避免大批量提取阻塞事件循环
+                    if config.ENABLE_EXTRACT_IN_THREAD:
+                        awemes = await asyncio.to_thread(_extract_batch, extractor, aweme_info_list)
+                    else:
+                        awemes = _extract_batch(extractor, aweme_info_list)
+
+                    # 批量保存本页视频数据，保存完成后再输出“已保存”信息
+                    await douyin_store.batch_update_douyin_awemes(awemes)
+
+                    for aweme in awemes:
+                        saved_count += 1
+                        saved_aweme_count += 1
+                        # 只显示部分视频ID（避免输出过多）
+                        if saved_count <= 3 or saved_count % 10 == 0:
+                            OutputFormatter.print_video_info(aweme.aweme_id, action="已保存")
+
+                    # 去掉未填充的空位
+                    aweme_id_list = [aweme_id for aweme_id in aweme_id_list if aweme_id]
 
                     if skipped_count > 0:
                         OutputFormatter.print_info(f"跳过已爬取视频: {skipped_count} 个")
@@ -226,13 +275,9 @@ class SearchHandler(BaseHandler):
                     # 爬虫请求间隔时间
                     await asyncio.sleep(config.CRAWLER_TIME_SLEEP)
 
-                except KeyboardInterrupt:
-                    # 用户中断
-                    checkpoint_data = None
-                    if checkpoint.id:
-                        cp = await self.checkpoint_manager.load_checkpoint_by_id(checkpoint.id)
-                        if cp:
-                            checkpoint_data = cp.model_dump()
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    # 用户中断（Ctrl+C 会取消爬虫任务；内存中的断点与已持久化的状态一致，无需回查存储）
+                    checkpoint_data = checkpoint.model_dump() if checkpoint.id else None
                     
                     OutputFormatter.print_interrupt_info(
                         reason="用户中断 (Ctrl+C)",
@@ -247,11 +292,7 @@ class SearchHandler(BaseHandler):
 
                 except Exception as ex:
                     # 其他异常
-                    checkpoint_data = None
-                    if checkpoint.id:
-                        cp = await self.checkpoint_manager.load_checkpoint_by_id(checkpoint.id)
-                        if cp:
-                            checkpoint_data = cp.model_dump()
+                    checkpoint_data = checkpoint.model_dump() if checkpoint.id else None
                     
                     OutputFormatter.print_interrupt_info(
                         reason=f"发生异常: {str(ex)[:100]}",
@@ -263,17 +304,17 @@ class SearchHandler(BaseHandler):
                         }
                     )
                     
-                    utils.log_error_with_context(
-                        utils.logger,
-                        ex,
-                        context={
-                            "搜索关键词": keyword,
-                            "当前页码": page,
-                            "搜索ID": dy_search_id if 'dy_search_id' in locals() else "未知",
-                            "检查点ID": checkpoint.id if checkpoint and hasattr(checkpoint, 'id') else "未启用",
-                        }
-                    )
-                    utils.logger.opt(exception=True).error("完整异常堆栈:")
+                    if self._err_enabled:
+                        utils.log_error_with_context(
+                            utils.logger,
+                            ex,
+                            context=lambda: {
+                                "搜索关键词": keyword,
+                                "当前页码": page,
+                                "搜索ID": dy_search_id or "未知",
+                                "检查点ID": checkpoint.id or "未启用",
+                            }
+                        )
                     return
 
                 # 更新检查点
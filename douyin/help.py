@@ -8,6 +8,7 @@ import random
 import time
 
 import httpx
+import orjson
 from pydantic import BaseModel, Field
 
 from constant.douyin import (
@@ -42,17 +43,17 @@ async def get_common_verify_params(user_agent: str) -> CommonVerifyParams:
     Returns:
         CommonVerifyParams: 通用验证参数对象
     """
-    utils.logger.info(
-        f"[get_common_verify_params] Start to get common verify params"
-    )
+    utils.logger.info("[get_common_verify_params] Start to get common verify params")
     token_manager = TokenManager(user_agent)
     ms_token = await token_manager.get_msToken()
     webid = await token_manager.gen_webid()
     verify_fp = VerifyFpManager.gen_verify_fp()
     s_v_web_id = VerifyFpManager.gen_s_v_web_id()
+    # 使用 loguru 的延迟格式化，INFO 关闭时不做字符串切片与拼接
     utils.logger.info(
-        f"[get_common_verify_params] Get ms_token: {ms_token[:20]}..., "
-        f"webid: {webid}, verify_fp: {verify_fp[:20]}..., s_v_web_id: {s_v_web_id[:20]}..."
+        "[get_common_verify_params] Get ms_token: {:.20}..., "
+        "webid: {}, verify_fp: {:.20}..., s_v_web_id: {:.20}...",
+        ms_token, webid, verify_fp, s_v_web_id,
     )
 
     return CommonVerifyParams(
@@ -117,26 +118,27 @@ class TokenManager:
         Raises:
             Exception: 如果获取失败或格式不正确
         """
-        async with AsyncHTTPClient() as client:
-            post_data = {
-                "magic": 538969122,
-                "version": 1,
-                "dataType": 8,
-                "strData": DOUYIN_MS_TOKEN_REQ_STR_DATA,
-                "tspFromClient": utils.get_current_timestamp(),
-                "url": 0,
-            }
-            headers = {
-                "Content-Type": "application/json; charset=utf-8",
-                "User-Agent": self._user_agent,
-            }
-            response = await client.post(
-                DOUYIN_MS_TOKEN_REQ_URL, json=post_data, headers=headers
-            )
-            ms_token = str(httpx.Cookies(response.cookies).get("msToken"))
-            if len(ms_token) not in [120, 128]:
-                raise Exception(f"获取msToken内容不符合要求: {ms_token}")
-            return ms_token
+        # 使用共享客户端复用连接池
+        client = await AsyncHTTPClient.get_shared()
+        post_data = {
+            "magic": 538969122,
+            "version": 1,
+            "dataType": 8,
+            "strData": DOUYIN_MS_TOKEN_REQ_STR_DATA,
+            "tspFromClient": utils.get_current_timestamp(),
+            "url": 0,
+        }
+        headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "User-Agent": self._user_agent,
+        }
+        response = await client.post(
+            DOUYIN_MS_TOKEN_REQ_URL, content=orjson.dumps(post_data), headers=headers
+        )
+        ms_token = str(httpx.Cookies(response.cookies).get("msToken"))
+        if len(ms_token) not in [120, 128]:
+            raise Exception(f"获取msToken内容不符合要求: {ms_token}")
+        return ms_token
 
     @classmethod
     def gen_fake_msToken(cls) -> str:
@@ -174,32 +176,33 @@ class TokenManager:
         Returns:
             str: webid字符串
         """
-        async with AsyncHTTPClient() as client:
-            post_data = {
-                "app_id": 6383,
-                "referer": f"https://www.douyin.com/",
-                "url": "https://www.douyin.com/",
-                "user_agent": self._user_agent,
-                "user_unique_id": "",
-            }
-            headers = {
-                "User-Agent": self._user_agent,
-                "Content-Type": "application/json; charset=UTF-8",
-                "Referer": "https://www.douyin.com/",
-            }
-            try:
-                response = await client.post(
-                    DOUYIN_WEBID_REQ_URL, json=post_data, headers=headers
-                )
-                webid = response.json().get("web_id")
-                if not webid:
-                    raise Exception("获取webid失败")
-                return webid
-            except Exception as e:
-                utils.logger.warning(
-                    f"gen_webid error: {e}, return a random webid"
-                )
-                return get_web_id()
+        # 使用共享客户端复用连接池
+        client = await AsyncHTTPClient.get_shared()
+        post_data = {
+            "app_id": 6383,
+            "referer": f"https://www.douyin.com/",
+            "url": "https://www.douyin.com/",
+            "user_agent": self._user_agent,
+            "user_unique_id": "",
+        }
+        headers = {
+            "User-Agent": self._user_agent,
+            "Content-Type": "application/json; charset=UTF-8",
+            "Referer": "https://www.douyin.com/",
+        }
+        try:
+            response = await client.post(
+                DOUYIN_WEBID_REQ_URL, content=orjson.dumps(post_data), headers=headers
+            )
+            webid = orjson.loads(response.content).get("web_id")
+            if not webid:
+                raise Exception("获取webid失败")
+            return webid
+        except Exception as e:
+            utils.logger.warning(
+                f"gen_webid error: {e}, return a random webid"
+            )
+            return get_web_id()
 
 
 class VerifyFpManager:
@@ -209,6 +212,8 @@ class VerifyFpManager:
     参考：https://github.com/johnserf-seed/f2
     """
     
+    _BASE_STR = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
     @classmethod
     def gen_verify_fp(cls) -> str:
         """
@@ -217,8 +222,6 @@ class VerifyFpManager:
         Returns:
             str: verifyFp字符串
         """
-        base_str = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-        t = len(base_str)
         milliseconds = int(round(time.time() * 1000))
         base36 = ""
         while milliseconds > 0:
@@ -229,16 +232,12 @@ class VerifyFpManager:
                 base36 = chr(ord("a") + remainder - 10) + base36
             milliseconds = int(milliseconds / 36)
         r = base36
-        o = [""] * 36
+        # random.choices 在C层一次生成36个随机字符，再覆盖固定位置
+        o = random.choices(cls._BASE_STR, k=36)
         o[8] = o[13] = o[18] = o[23] = "_"
         o[14] = "4"
-
-        for i in range(36):
-            if not o[i]:
-                n = 0 or int(random.random() * t)
-                if i == 19:
-                    n = 3 & n | 8
-                o[i] = base_str[n]
+        n = cls._BASE_STR.index(o[19])
+        o[19] = cls._BASE_STR[3 & n | 8]
 
         return "verify_" + r + "_" + "".join(o)
 
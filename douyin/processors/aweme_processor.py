@@ -53,6 +53,7 @@ class AwemeProcessor:
     ) -> Optional[DouyinAweme]:
         """
         异步获取视频详情
+        只负责获取数据，保存由批量调用方统一处理
         
         Args:
             aweme_id: 视频ID
@@ -68,8 +69,6 @@ class AwemeProcessor:
                 # 调用API获取视频详情
                 aweme = await self.dy_client.get_video_by_id(aweme_id)
                 if aweme:
-                    # 保存视频数据到存储层
-                    await douyin_store.update_douyin_aweme(aweme)
                     utils.logger.info(
                         f"[AwemeProcessor.get_aweme_detail_async_task] Successfully get aweme detail: {aweme_id}"
                     )
@@ -92,13 +91,13 @@ class AwemeProcessor:
                 return None
 
             finally:
-                # 更新断点信息（如果启用了断点续爬）
-                if checkpoint_id and self.checkpoint_manager:
-                    is_success_crawled = aweme is not None
+                # 获取失败时更新断点信息（如果启用了断点续爬）
+                # 获取成功的视频由调用方在数据保存后再标记，避免数据未保存就被标记为已爬取
+                if aweme is None and checkpoint_id and self.checkpoint_manager:
                     await self.checkpoint_manager.update_note_to_checkpoint(
                         checkpoint_id=checkpoint_id,
                         note_id=aweme_id,
-                        is_success_crawled=is_success_crawled,
+                        is_success_crawled=False,
                         is_success_crawled_comments=False,
                         current_note_comment_cursor=None,
                     )
@@ -108,16 +107,18 @@ class AwemeProcessor:
     ) -> List[str]:
         """
         批量获取视频列表
-        并发获取指定ID列表的视频详情并保存数据
+        并发获取指定ID列表的视频详情，并统一批量保存数据
+        中途被中断时也会保存已获取的视频；视频在保存后才在断点中标记为爬取成功
         
         Args:
             aweme_ids: 视频ID列表
             checkpoint_id: 检查点ID（用于断点续爬）
             
         Returns:
-            List[str]: 成功处理的视频ID列表
+            List[str]: 成功处理的视频ID列表（按完成顺序）
         """
         task_list, processed_aweme_ids = [], []
+        awemes: List[DouyinAweme] = []
         
         for aweme_id in aweme_ids:
             # 检查是否已经爬取过（如果启用了断点续爬）
@@ -145,12 +146,39 @@ class AwemeProcessor:
             )
             task_list.append(task)
 
-        # 并发执行所有任务
-        aweme_details = await asyncio.gather(*task_list)
-        
-        # 收集成功处理的视频ID
-        for aweme in aweme_details:
-            if aweme:
-                processed_aweme_ids.append(aweme.aweme_id)
+        # 并发执行所有任务，按完成顺序逐个收集结果（不等待最慢的请求）
+        # 注意：返回的ID顺序为完成顺序，调用方不依赖原始顺序
+        try:
+            for fut in asyncio.as_completed(task_list):
+                aweme = await fut
+                if aweme:
+                    processed_aweme_ids.append(aweme.aweme_id)
+                    awemes.append(aweme)
+        finally:
+            # 即使中途被中断或出错，也保存已获取的视频，保存成功后再标记断点
+            if awemes:
+                await douyin_store.batch_update_douyin_awemes(awemes)
+                await self._mark_awemes_crawled(awemes, checkpoint_id)
 
         return processed_aweme_ids
+
+    async def _mark_awemes_crawled(
+        self, awemes: List[DouyinAweme], checkpoint_id: str = ""
+    ):
+        """
+        将已保存的视频标记为爬取成功（如果启用了断点续爬）
+        
+        Args:
+            awemes: 已保存的视频列表
+            checkpoint_id: 检查点ID（用于断点续爬）
+        """
+        if not checkpoint_id or not self.checkpoint_manager:
+            return
+        for aweme in awemes:
+            await self.checkpoint_manager.update_note_to_checkpoint(
+                checkpoint_id=checkpoint_id,
+                note_id=aweme.aweme_id,
+                is_success_crawled=True,
+                is_success_crawled_comments=False,
+                current_note_comment_cursor=None,
+            )
@@ -6,7 +6,7 @@
 
 import asyncio
 from asyncio import Task
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, Set, TYPE_CHECKING
 
 import config
 from config.base_config import PER_NOTE_MAX_COMMENTS_COUNT
@@ -20,6 +20,10 @@ if TYPE_CHECKING:
     # from repo.checkpoint.checkpoint_store import CheckpointRepoManager
 
 
+# 每完成多少个视频的评论任务输出一次进度
+COMMENT_PROGRESS_LOG_INTERVAL = 10
+
+
 class CommentProcessor:
     """
     评论数据处理器
@@ -66,38 +70,89 @@ class CommentProcessor:
         # 如果未启用评论爬取，直接返回
         if not config.ENABLE_GET_COMMENTS:
             utils.logger.info(
-                f"[CommentProcessor.batch_get_aweme_comments] Crawling comment mode is not enabled"
+                "[CommentProcessor.batch_get_aweme_comments] Crawling comment mode is not enabled"
             )
             return
 
-        utils.logger.info(f"批量获取评论: {len(aweme_list)} 个视频")
-        
-        task_list: List[Task] = []
-        for aweme_id in aweme_list:
-            if not aweme_id:
-                continue
+        utils.logger.info("批量获取评论: {} 个视频", len(aweme_list))
 
-            # 检查是否已经爬取过评论（如果启用了断点续爬）
-            if checkpoint_id and self.checkpoint_manager:
-                if await self.checkpoint_manager.check_note_comments_is_crawled_in_checkpoint(
-                    checkpoint_id=checkpoint_id, note_id=aweme_id
-                ):
-                    utils.logger.debug(f"跳过已爬取评论的视频: {aweme_id}")
+        aweme_ids = [aweme_id for aweme_id in aweme_list if aweme_id]
+
+        # 预先批量查询已爬取评论的视频（如果启用了断点续爬），生产循环中不再等待IO
+        crawled_ids: Set[str] = set()
+        if checkpoint_id and self.checkpoint_manager:
+            crawled_ids = await self._get_comments_crawled_ids(checkpoint_id, aweme_ids)
+
+        task_list: List[Task] = []
+        # 生产循环也放在 try 中：阻塞在信号量上时被中断，同样要取消已创建的任务
+        try:
+            for aweme_id in aweme_ids:
+                if aweme_id in crawled_ids:
+                    utils.logger.debug("跳过已爬取评论的视频: {}", aweme_id)
                     continue
 
-            # 创建异步任务
-            task = asyncio.create_task(
-                self.get_comments_async_task(
-                    aweme_id,
-                    checkpoint_id=checkpoint_id,
-                ),
-                name=aweme_id,
-            )
-            task_list.append(task)
+                # 先获取信号量再创建任务，同时驻留的任务数不超过并发上限
+                await self.crawler_comment_semaphore.acquire()
+                task = asyncio.create_task(
+                    self.get_comments_async_task(
+                        aweme_id,
+                        checkpoint_id=checkpoint_id,
+                    ),
+                    name=aweme_id,
+                )
+                task.add_done_callback(lambda _: self.crawler_comment_semaphore.release())
+                task_list.append(task)
+
+            # 按完成顺序等待任务，实时输出进度；单个视频失败不影响整批
+            total = len(task_list)
+            completed = 0
+            for fut in asyncio.as_completed(task_list):
+                try:
+                    await fut
+                except Exception as e:
+                    utils.logger.error(
+                        "[CommentProcessor.batch_get_aweme_comments] get comments failed, error: {}",
+                        e,
+                    )
+                completed += 1
+                if completed % COMMENT_PROGRESS_LOG_INTERVAL == 0 or completed == total:
+                    utils.logger.info(
+                        "[CommentProcessor.batch_get_aweme_comments] comments progress: {}/{}",
+                        completed, total,
+                    )
+        except (asyncio.CancelledError, KeyboardInterrupt):
+            # 中断时取消尚未完成的评论任务，避免其在后台继续运行
+            for task in task_list:
+                if not task.done():
+                    task.cancel()
+            raise
+
+    async def _get_comments_crawled_ids(
+        self,
+        checkpoint_id: str,
+        aweme_ids: List[str],
+    ) -> Set[str]:
+        """
+        查询断点中已完成评论爬取的视频ID
+        一次性加载检查点并在内存中过滤，代替逐个视频查询断点存储
+        
+        Args:
+            checkpoint_id: 检查点ID
+            aweme_ids: 视频ID列表
+            
+        Returns:
+            Set[str]: 已完成评论爬取的视频ID集合
+        """
+        checkpoint = await self.checkpoint_manager.load_checkpoint_by_id(checkpoint_id)
+        if not checkpoint or not checkpoint.crawled_note_list:
+            return set()
 
-        # 等待所有任务完成
-        if len(task_list) > 0:
-            await asyncio.wait(task_list)
+        wanted_ids = set(aweme_ids)
+        return {
+            note.note_id
+            for note in checkpoint.crawled_note_list
+            if note.is_success_crawled_comments and note.note_id in wanted_ids
+        }
 
     async def get_comments_async_task(
         self,
@@ -112,110 +167,188 @@ class CommentProcessor:
             aweme_id: 视频ID
             checkpoint_id: 检查点ID（用于断点续爬）
         """
-        async with self.crawler_comment_semaphore:
-            try:
-                utils.logger.debug(f"开始获取评论: {aweme_id}")
-                # 获取视频的所有评论
-                await self.get_aweme_all_comments(
-                    aweme_id=aweme_id,
-                    checkpoint_id=checkpoint_id
-                )
-                utils.logger.info(
-                    f"[CommentProcessor.get_comments_async_task] aweme_id: {aweme_id} comments have all been obtained and filtered ..."
-                )
-            except DataFetchError as e:
-                utils.logger.error(
-                    f"[CommentProcessor.get_comments_async_task] aweme_id: {aweme_id} get comments failed, error: {e}"
-                )
+        # 并发由 batch_get_aweme_comments 在创建任务前获取的信号量控制
+        try:
+            utils.logger.debug("开始获取评论: {}", aweme_id)
+            # 获取视频的所有评论
+            await self.get_aweme_all_comments(
+                aweme_id=aweme_id,
+                checkpoint_id=checkpoint_id
+            )
+            utils.logger.info(
+                "[CommentProcessor.get_comments_async_task] aweme_id: {} comments have all been obtained and filtered ...",
+                aweme_id,
+            )
+        except DataFetchError as e:
+            utils.logger.error(
+                "[CommentProcessor.get_comments_async_task] aweme_id: {} get comments failed, error: {}",
+                aweme_id, e,
+            )
 
     async def get_aweme_all_comments(
         self,
         aweme_id: str,
         checkpoint_id: str = ""
-    ):
+    ) -> int:
         """
         获取视频的所有评论（包括分页）
+        评论写入存储后即可释放，这里只统计数量，不在内存中累积整条视频的评论
         
         Args:
             aweme_id: 视频ID
             checkpoint_id: 检查点ID（用于断点续爬）
             
         Returns:
-            List[DouyinAwemeComment]: 评论列表
+            int: 获取到的评论数量（包括二级评论）
         """
-        result = []
+        collected = 0
         comments_has_more = 1
         comments_cursor = 0
 
+        # 断点续爬开关在整个分页过程中不变，只判断一次并绑定游标更新方法
+        update_cursor = (
+            self.checkpoint_manager.update_note_comment_cursor
+            if checkpoint_id and self.checkpoint_manager
+            else None
+        )
+
         # 从checkpoint中获取上次保存的评论游标（如果启用了断点续爬）
-        if checkpoint_id and self.checkpoint_manager:
+        if update_cursor:
             latest_comment_cursor = await self.checkpoint_manager.get_note_comment_cursor(
                 checkpoint_id=checkpoint_id, note_id=aweme_id
             )
             if latest_comment_cursor:
                 try:
                     comments_cursor = int(latest_comment_cursor)
-                    utils.logger.debug(f"从断点继续: cursor={comments_cursor}")
+                    utils.logger.debug("从断点继续: cursor={}", comments_cursor)
                 except (ValueError, TypeError):
                     utils.logger.warning(
-                        f"[CommentProcessor.get_aweme_all_comments] Invalid cursor format: {latest_comment_cursor}, starting from beginning"
+                        "[CommentProcessor.get_aweme_all_comments] Invalid cursor format: {}, starting from beginning",
+                        latest_comment_cursor,
                     )
                     comments_cursor = 0
 
-        # 循环获取所有评论（分页）
-        while comments_has_more:
-            # 获取一页评论
-            comments, comments_res = await self.dy_client.get_aweme_comments(
-                aweme_id, comments_cursor
-            )
-            comments_has_more = comments_res.get("has_more", 0)
-            comments_cursor = comments_res.get("cursor", 0)
-
-            # 更新评论游标到checkpoint中（如果启用了断点续爬）
-            if checkpoint_id and self.checkpoint_manager and comments_cursor is not None:
-                await self.checkpoint_manager.update_note_comment_cursor(
-                    checkpoint_id=checkpoint_id,
-                    note_id=aweme_id,
-                    comment_cursor=str(comments_cursor),
+        # 评论写库由独立协程消费队列完成，与翻页请求流水线化
+        comment_queue: "asyncio.Queue[Optional[List[DouyinAwemeComment]]]" = asyncio.Queue(maxsize=2)
+        writer = asyncio.create_task(self._drain_comment_queue(aweme_id, comment_queue))
+        pending_cursor_write: Optional[Task] = None
+        save_error: Optional[Exception] = None
+
+        try:
+            # 循环获取所有评论（分页）
+            while comments_has_more:
+                # 获取一页评论
+                comments, comments_res = await self.dy_client.get_aweme_comments(
+                    aweme_id, comments_cursor
                 )
+                comments_has_more = comments_res.get("has_more", 0)
+                comments_cursor = comments_res.get("cursor", 0)
 
-            if not comments:
-                continue
+                # 更新评论游标到checkpoint中（如果启用了断点续爬）
+                # 游标在后台写入，与后续请求重叠；同一视频最多只有一个未完成的写入，保证写入顺序
+                if update_cursor and comments_cursor is not None:
+                    if pending_cursor_write:
+                        await pending_cursor_write
+                    pending_cursor_write = asyncio.create_task(
+                        update_cursor(
+                            checkpoint_id=checkpoint_id,
+                            note_id=aweme_id,
+                            comment_cursor=str(comments_cursor),
+                        )
+                    )
+
+                if not comments:
+                    continue
             
-            result.extend(comments)
+                collected += len(comments)
             
-            # 保存评论到数据库
-            await douyin_store.batch_update_dy_aweme_comments(aweme_id, comments)
+                # 交给写入协程保存，下一页请求与本页写库重叠进行
+                await comment_queue.put(comments)
             
-            # 检查是否超过最大评论数量限制
-            if (
-                PER_NOTE_MAX_COMMENTS_COUNT
-                and len(result) >= PER_NOTE_MAX_COMMENTS_COUNT
-            ):
-                utils.logger.info(
-                    f"[CommentProcessor.get_aweme_all_comments] The number of comments exceeds the limit: {PER_NOTE_MAX_COMMENTS_COUNT}"
-                )
-                break
+                # 检查是否超过最大评论数量限制
+                if (
+                    PER_NOTE_MAX_COMMENTS_COUNT
+                    and collected >= PER_NOTE_MAX_COMMENTS_COUNT
+                ):
+                    utils.logger.info(
+                        "[CommentProcessor.get_aweme_all_comments] The number of comments exceeds the limit: {}",
+                        PER_NOTE_MAX_COMMENTS_COUNT,
+                    )
+                    break
             
-            # 爬虫请求间隔时间
-            await asyncio.sleep(config.CRAWLER_TIME_SLEEP)
+                # 爬虫请求间隔时间
+                await asyncio.sleep(config.CRAWLER_TIME_SLEEP)
             
-            # 获取二级评论（如果启用了）
-            sub_comments = await self.get_comments_all_sub_comments(
-                aweme_id, comments
-            )
-            result.extend(sub_comments)
+                # 获取二级评论（如果启用了）
+                sub_comments = await self.get_comments_all_sub_comments(
+                    aweme_id, comments
+                )
+                collected += len(sub_comments)
+
+                # 二级评论可能已使总数超限，此时不再请求下一页
+                if (
+                    PER_NOTE_MAX_COMMENTS_COUNT
+                    and collected >= PER_NOTE_MAX_COMMENTS_COUNT
+                ):
+                    utils.logger.info(
+                        "[CommentProcessor.get_aweme_all_comments] The number of comments exceeds the limit: {}",
+                        PER_NOTE_MAX_COMMENTS_COUNT,
+                    )
+                    break
+        finally:
+            # 通知写入协程结束，并等待已入队的评论全部写入
+            await comment_queue.put(None)
+            save_error = await writer
+            # 等待最后一次游标写入完成，再写入完成标记
+            if pending_cursor_write:
+                await pending_cursor_write
+
+        # 有评论批次保存失败时不写入完成标记，断点续爬时重新爬取该视频的评论
+        if save_error is not None:
+            raise save_error
 
         # 标记该视频的评论已完全爬取（如果启用了断点续爬）
-        if checkpoint_id and self.checkpoint_manager:
-            await self.checkpoint_manager.update_note_comment_cursor(
+        if update_cursor:
+            await update_cursor(
                 checkpoint_id=checkpoint_id,
                 note_id=aweme_id,
                 comment_cursor=str(comments_cursor),
                 is_success_crawled_comments=True,
             )
 
-        return result
+        return collected
+
+    async def _drain_comment_queue(
+        self,
+        aweme_id: str,
+        comment_queue: "asyncio.Queue[Optional[List[DouyinAwemeComment]]]",
+    ) -> Optional[Exception]:
+        """
+        消费评论队列并写入存储，收到 None 时结束
+        单批写入失败时记录日志并继续消费，保证生产方不会阻塞；第一个异常在结束时返回给调用方
+        
+        Args:
+            aweme_id: 视频ID
+            comment_queue: 待保存的评论队列
+            
+        Returns:
+            Optional[Exception]: 第一次保存失败的异常，全部保存成功时返回None
+        """
+        first_error: Optional[Exception] = None
+        while True:
+            comments = await comment_queue.get()
+            if comments is None:
+                return first_error
+            try:
+                # 保存评论到数据库
+                await douyin_store.batch_update_dy_aweme_comments(aweme_id, comments)
+            except Exception as e:
+                utils.logger.error(
+                    "[CommentProcessor._drain_comment_queue] aweme_id: {} save comments failed, error: {}",
+                    aweme_id, e,
+                )
+                if first_error is None:
+                    first_error = e
 
     async def get_comments_all_sub_comments(
         self,
@@ -232,40 +365,85 @@ class CommentProcessor:
             
         Returns:
             List[DouyinAwemeComment]: 二级评论列表
+            
+        Raises:
+            DataFetchError: 任一一级评论的回复获取失败（所有回复链结束后抛出第一个异常）
         """
         # 如果未启用二级评论爬取，直接返回
         if not config.ENABLE_GET_SUB_COMMENTS:
             utils.logger.info(
-                f"[CommentProcessor.get_comments_all_sub_comments] Crawling sub_comment mode is not enabled"
+                "[CommentProcessor.get_comments_all_sub_comments] Crawling sub_comment mode is not enabled"
             )
             return []
         
+        # 多个一级评论的回复分页链并发获取，单页内并发数受信号量限制
+        sub_comment_semaphore = asyncio.Semaphore(config.MAX_SUB_COMMENT_CONCURRENCY or 1)
+        task_list = [
+            self._get_one_comment_sub_comments(aweme_id, comment, sub_comment_semaphore)
+            for comment in comments
+            if comment.sub_comment_count > 0
+        ]
+        results = await asyncio.gather(*task_list, return_exceptions=True)
+
         result = []
-        for comment in comments:
-            # 检查是否有回复
-            reply_comment_total = int(comment.sub_comment_count) if comment.sub_comment_count else 0
-            if reply_comment_total > 0:
-                comment_id = comment.comment_id
-                sub_comments_has_more = 1
-                sub_comments_cursor = 0
+        first_error: Optional[BaseException] = None
+        for comment_result in results:
+            if isinstance(comment_result, BaseException):
+                utils.logger.error(
+                    "[CommentProcessor.get_comments_all_sub_comments] aweme_id: {} get sub comments failed, error: {}",
+                    aweme_id, comment_result,
+                )
+                if first_error is None:
+                    first_error = comment_result
+                continue
+            result.extend(comment_result)
+
+        # 任一回复链失败时抛出，调用方不会把该视频的评论标记为已完成，断点续爬时重新获取
+        if first_error is not None:
+            raise first_error
+        
+        return result
+
+    async def _get_one_comment_sub_comments(
+        self,
+        aweme_id: str,
+        comment: DouyinAwemeComment,
+        semaphore: asyncio.Semaphore,
+    ) -> List[DouyinAwemeComment]:
+        """
+        获取单条一级评论下的所有二级评论（分页）
+        
+        Args:
+            aweme_id: 视频ID
+            comment: 一级评论
+            semaphore: 控制二级评论并发的信号量
+            
+        Returns:
+            List[DouyinAwemeComment]: 该评论下的二级评论列表
+        """
+        result = []
+        comment_id = comment.comment_id
+        sub_comments_has_more = 1
+        sub_comments_cursor = 0
+        
+        async with semaphore:
+            # 循环获取所有二级评论（分页）
+            while sub_comments_has_more:
+                sub_comments, sub_comments_res = await self.dy_client.get_sub_comments(
+                    comment_id, sub_comments_cursor, aweme_id
+                )
+                sub_comments_has_more = sub_comments_res.get("has_more", 0)
+                sub_comments_cursor = sub_comments_res.get("cursor", 0)
                 
-                # 循环获取所有二级评论（分页）
-                while sub_comments_has_more:
-                    sub_comments, sub_comments_res = await self.dy_client.get_sub_comments(
-                        comment_id, sub_comments_cursor, aweme_id
-                    )
-                    sub_comments_has_more = sub_comments_res.get("has_more", 0)
-                    sub_comments_cursor = sub_comments_res.get("cursor", 0)
-                    
-                    if not sub_comments:
-                        continue
-                    
-                    result.extend(sub_comments)
-                    
-                    # 保存子评论到数据库
-                    await douyin_store.batch_update_dy_aweme_comments(aweme_id, sub_comments)
-
-                    # 爬虫请求间隔时间
-                    await asyncio.sleep(config.CRAWLER_TIME_SLEEP)
+                if not sub_comments:
+                    continue
+                
+                result.extend(sub_comments)
+                
+                # 保存子评论到数据库
+                await douyin_store.batch_update_dy_aweme_comments(aweme_id, sub_comments)
+
+                # 爬虫请求间隔时间
+                await asyncio.sleep(config.CRAWLER_TIME_SLEEP)
         
         return result
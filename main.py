@@ -5,13 +5,16 @@ DouyinCrawler 主入口文件
 """
 
 import asyncio
+import signal
 import sys
+from typing import Callable
 
 import cmd_arg
 import config
 import constant
 from base.base_crawler import AbstractCrawler
 from douyin import DouYinCrawler
+from pkg.tools.output_formatter import OutputFormatter
 from pkg.tools.utils import init_logging_config
 
 
@@ -81,26 +84,78 @@ async def main():
 
     # 创建爬虫实例
     crawler = CrawlerFactory.create_crawler(platform=constant.DOUYIN_PLATFORM_NAME)
+
+    # 初始化并启动爬虫，Ctrl+C 时取消该任务，使各处理器的 finally 能保存断点
+    crawl_task = asyncio.create_task(run_crawler(crawler))
+    restore_interrupt_handler = install_interrupt_handler(crawl_task)
+    try:
+        await crawl_task
+    except asyncio.CancelledError:
+        OutputFormatter.print_interrupt_info(
+            reason="用户中断 (Ctrl+C)",
+            checkpoint_data=None  # 断点信息会在handler中输出
+        )
+    finally:
+        try:
+            # 清理爬虫资源（关闭HTTP客户端等），清理完成前 Ctrl+C 不会打断清理
+            await crawler.cleanup()
+        finally:
+            restore_interrupt_handler()
+
+
+async def run_crawler(crawler: AbstractCrawler):
+    """
+    异步初始化并启动爬虫
     
-    # 异步初始化爬虫
+    Args:
+        crawler: 爬虫实例
+    """
     await crawler.async_initialize()
+    await crawler.start()
+
+
+def install_interrupt_handler(task: asyncio.Task) -> Callable[[], None]:
+    """
+    安装 Ctrl+C (SIGINT) 处理函数，收到信号时取消爬虫任务而不是直接退出
     
-    # 启动爬虫
+    Args:
+        task: 需要在中断时取消的爬虫任务
+        
+    Returns:
+        Callable[[], None]: 恢复原有信号处理的函数
+    """
+    loop = asyncio.get_running_loop()
     try:
-        await crawler.start()
-    finally:
-        # 清理爬虫资源（关闭HTTP客户端等）
-        await crawler.cleanup()
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
+        return lambda: loop.remove_signal_handler(signal.SIGINT)
+    except NotImplementedError:
+        # Windows 事件循环不支持 add_signal_handler，退回到 signal.signal
+        previous_handler = signal.signal(
+            signal.SIGINT, lambda *_: loop.call_soon_threadsafe(task.cancel)
+        )
+        return lambda: signal.signal(signal.SIGINT, previous_handler)
+
+
+def install_uvloop():
+    """
+    在非Windows平台上使用uvloop作为事件循环（未安装时回退到默认事件循环）
+    """
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
 
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
-        # 运行主函数
-        asyncio.get_event_loop().run_until_complete(main())
+        # 运行主函数（asyncio.run 结束时会取消残留任务并关闭事件循环）
+        asyncio.run(main())
     except KeyboardInterrupt:
-        # 处理Ctrl+C中断
-        from pkg.tools.output_formatter import OutputFormatter
-        
+        # 处理爬虫任务之外的Ctrl+C中断（启动阶段或中断处理安装之前/恢复之后）
         OutputFormatter.print_interrupt_info(
             reason="用户中断 (Ctrl+C)",
             checkpoint_data=None  # 断点信息会在handler中输出
@@ -133,9 +188,6 @@ if __name__ == "__main__":
             level="CRITICAL"
         )
         
-        # 记录完整堆栈
-        utils.logger.opt(exception=True).critical("完整异常堆栈:")
-        
         print("\n" + "="*80)
         print("[提示] 如果问题持续存在，请检查:")
         print("   1. 日志文件: logs/douyin/ 目录下的最新日志")
@@ -21,10 +21,10 @@ class DouyinAweme(BaseModel):
     create_time: str = Field(default="", description="视频发布时间戳")
     
     # 视频统计数据
-    liked_count: str = Field(default="", description="视频点赞数")
-    comment_count: str = Field(default="", description="视频评论数")
-    share_count: str = Field(default="", description="视频分享数")
-    collected_count: str = Field(default="", description="视频收藏数")
+    liked_count: int = Field(default=0, description="视频点赞数")
+    comment_count: int = Field(default=0, description="视频评论数")
+    share_count: int = Field(default=0, description="视频分享数")
+    collected_count: int = Field(default=0, description="视频收藏数")
     
     # 视频URL信息
     aweme_url: str = Field(default="", description="视频详情页URL")
@@ -58,8 +58,8 @@ class DouyinAwemeComment(BaseModel):
     create_time: str = Field(default="", description="评论时间戳")
     
     # 评论统计数据
-    sub_comment_count: str = Field(default="", description="评论回复数")
-    like_count: str = Field(default="", description="点赞数")
+    sub_comment_count: int = Field(default=0, description="评论回复数")
+    like_count: int = Field(default=0, description="点赞数")
     
     # 评论关系信息
     parent_comment_id: str = Field(default="", description="父评论ID（如果是回复）")
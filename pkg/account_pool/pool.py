@@ -6,9 +6,10 @@
 
 import asyncio
 import os
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, List, Optional
 
-import pandas as pd
+from openpyxl import load_workbook
 
 import config
 import constant
@@ -40,6 +41,13 @@ class AccountPoolManager:
         self._platform_name = platform_name
         self._account_save_type = account_save_type
         self._account_list: List[AccountInfoModel] = []
+        # 可用（NORMAL）账号的轮询队列，队首即下一个返回的账号
+        self._ready_accounts: Deque[AccountInfoModel] = deque()
+        # 重新加载账号池的锁，并发请求同时耗尽账号时只重新加载一次
+        self._reload_lock = asyncio.Lock()
+        # 最近一次解析的Excel账号（未被修改的原始副本）及对应文件修改时间
+        self._cached_mtime: float = 0.0
+        self._cached_accounts: List[AccountInfoModel] = []
 
     async def async_initialize(self):
         """
@@ -64,28 +72,51 @@ class AccountPoolManager:
         account_cookies_file_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)), account_cookies_file_name
         )
-        
-        # 读取Excel文件
-        df = pd.read_excel(
-            account_cookies_file_path, sheet_name=self._platform_name, engine="openpyxl"
-        )
-        
-        account_id = 1
-        for _, row in df.iterrows():
-            account = AccountInfoModel(
-                id=row.get("id", account_id),
-                account_name=row.get("account_name", ""),
-                cookies=row.get("cookies", ""),
-                status=AccountStatusEnum.NORMAL.value,
-                platform_name=self._platform_name,
-            )
-            self.add_account(account)
-            account_id += 1
+
+        # 文件未修改时直接复用上次解析结果，避免重复读取和解压xlsx
+        mtime = os.path.getmtime(account_cookies_file_path)
+        if self._cached_accounts and mtime == self._cached_mtime:
+            for account in self._cached_accounts:
+                self.add_account(account.model_copy())
             utils.logger.info(
-                f"[AccountPoolManager.load_accounts_from_xlsx] load account {account}"
+                f"[AccountPoolManager.load_accounts_from_xlsx] accounts_cookies.xlsx not modified, reuse {len(self._cached_accounts)} cached accounts"
             )
+            return
+
+        # 以只读模式流式读取Excel文件，避免构建完整的DataFrame
+        loaded_accounts: List[AccountInfoModel] = []
+        workbook = load_workbook(account_cookies_file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook[self._platform_name].iter_rows(values_only=True)
+            header = next(rows, ())
+            column_index = {name: idx for idx, name in enumerate(header) if name}
+
+            def _cell(row: tuple, name: str):
+                idx = column_index.get(name)
+                return row[idx] if idx is not None and idx < len(row) else None
+
+            account_id = 1
+            for row in rows:
+                # 跳过空行
+                if not any(cell is not None for cell in row):
+                    continue
+                account = AccountInfoModel(
+                    id=_cell(row, "id") or account_id,
+                    account_name=_cell(row, "account_name") or "",
+                    cookies=_cell(row, "cookies") or "",
+                    status=AccountStatusEnum.NORMAL.value,
+                    platform_name=self._platform_name,
+                )
+                loaded_accounts.append(account)
+                self.add_account(account.model_copy())
+                account_id += 1
+        finally:
+            workbook.close()
+
+        self._cached_mtime = mtime
+        self._cached_accounts = loaded_accounts
         utils.logger.info(
-            f"[AccountPoolManager.load_accounts_from_xlsx] all account load success"
+            f"[AccountPoolManager.load_accounts_from_xlsx] all account load success, loaded {len(loaded_accounts)} accounts for {self._platform_name}"
         )
 
 
@@ -99,13 +130,14 @@ class AccountPoolManager:
         Raises:
             Exception: 如果没有可用的账号
         """
-        # 首先尝试从现有列表中查找NORMAL状态的账号（不移除）
-        for account in self._account_list:
-            if account.status == AccountStatusEnum.NORMAL.value:
-                utils.logger.info(
-                    f"[AccountPoolManager.get_active_account] get active account {account}"
-                )
-                return account
+        # 首先从可用队列中轮询获取账号
+        account = self._next_ready_account()
+        if account:
+            utils.logger.info(
+                "[AccountPoolManager.get_active_account] get active account id={} name={}",
+                account.id, account.account_name,
+            )
+            return account
 
         # 如果没有找到可用账号，尝试重新加载账号池
         utils.logger.warning(
@@ -114,13 +146,23 @@ class AccountPoolManager:
         self._reload_accounts()
         
         # 重新加载后再次查找
-        for account in self._account_list:
-            if account.status == AccountStatusEnum.NORMAL.value:
-                utils.logger.info(
-                    f"[AccountPoolManager.get_active_account] get active account after reload: {account}"
-                )
-                return account
+        account = self._next_ready_account()
+        if account:
+            utils.logger.info(
+                "[AccountPoolManager.get_active_account] get active account after reload: id={} name={}",
+                account.id, account.account_name,
+            )
+            return account
+
+        self._raise_no_active_account()
 
+    def _raise_no_active_account(self):
+        """
+        记录账号池详情并抛出没有可用账号的异常
+        
+        Raises:
+            Exception: 账号池中没有可用的账号
+        """
         error = Exception("账号池中没有可用的账号")
         utils.log_error_with_context(
             utils.logger,
@@ -134,6 +176,69 @@ class AccountPoolManager:
             level="CRITICAL"
         )
         raise error
+
+    async def aget_active_account(self) -> AccountInfoModel:
+        """
+        获取一个可用的账号（异步版本，供并发调用方使用）
+        没有可用账号时在锁内于线程中重新加载，其他等待者在获得锁后先复查账号池
+        
+        Returns:
+            AccountInfoModel: 账号信息模型
+            
+        Raises:
+            Exception: 如果没有可用的账号
+        """
+        account = self._next_ready_account()
+        if account:
+            utils.logger.info(
+                "[AccountPoolManager.aget_active_account] get active account id={} name={}",
+                account.id, account.account_name,
+            )
+            return account
+
+        async with self._reload_lock:
+            # 复查：等待锁期间其他协程可能已完成重新加载
+            account = self._next_ready_account()
+            if account:
+                utils.logger.info(
+                    "[AccountPoolManager.aget_active_account] get active account after waiting reload: id={} name={}",
+                    account.id, account.account_name,
+                )
+                return account
+
+            utils.logger.warning(
+                "[AccountPoolManager.aget_active_account] No active account found, try to reload account pool"
+            )
+            # 在线程中解析Excel，避免阻塞事件循环；锁保证同一时间只有一个协程在重新加载
+            await asyncio.to_thread(self._reload_accounts)
+
+            account = self._next_ready_account()
+            if account:
+                utils.logger.info(
+                    "[AccountPoolManager.aget_active_account] get active account after reload: id={} name={}",
+                    account.id, account.account_name,
+                )
+                return account
+
+        self._raise_no_active_account()
+
+    def _next_ready_account(self) -> Optional[AccountInfoModel]:
+        """
+        从可用队列中轮询取出一个NORMAL状态的账号
+        取出后将其移到队尾，使多个账号轮流承担请求
+        
+        Returns:
+            Optional[AccountInfoModel]: 可用账号，队列中没有可用账号时返回None
+        """
+        # 惰性剔除已不是NORMAL状态的账号
+        while self._ready_accounts and self._ready_accounts[0].status != AccountStatusEnum.NORMAL.value:
+            self._ready_accounts.popleft()
+        if not self._ready_accounts:
+            return None
+
+        account = self._ready_accounts[0]
+        self._ready_accounts.rotate(-1)
+        return account
     
     def _reload_accounts(self):
         """
@@ -145,6 +250,7 @@ class AccountPoolManager:
         )
         # 清空当前列表
         self._account_list.clear()
+        self._ready_accounts.clear()
         
         # 重新加载账号（仅支持Excel）
         if self._account_save_type == EXCEL_ACCOUNT_SAVE:
@@ -162,6 +268,8 @@ class AccountPoolManager:
             account: 账号信息模型
         """
         self._account_list.append(account)
+        if account.status == AccountStatusEnum.NORMAL.value:
+            self._ready_accounts.append(account)
 
     async def update_account_status(
         self, account: AccountInfoModel, status: AccountStatusEnum
@@ -175,9 +283,14 @@ class AccountPoolManager:
         """
         account.status = status.value
         account.invalid_timestamp = utils.get_current_timestamp()
+        if status != AccountStatusEnum.NORMAL:
+            try:
+                self._ready_accounts.remove(account)
+            except ValueError:
+                pass
         
         # Excel中的账户状态暂时不更新（仅内存中更新）
-        utils.logger.info(
+        utils.logger.debug(
             f"[AccountPoolManager.update_account_status] Account {account.account_name} status updated to {status.value} (in memory only)"
         )
 
@@ -225,21 +338,15 @@ class AccountWithIpPoolManager(AccountPoolManager):
         """
         ip_info: Optional[IpInfoModel] = None
         
-        try:
-            account: AccountInfoModel = self.get_active_account()
-        except Exception:
-            # 如果获取账号失败，尝试重新加载账号池
-            utils.logger.info(
-                "[AccountWithIpPoolManager.get_account_with_ip_info] No active account, reloading from Excel"
-            )
-            self._reload_accounts()
-            account: AccountInfoModel = self.get_active_account()
+        # 没有可用账号时 aget_active_account 会在锁内重新加载账号池
+        account: AccountInfoModel = await self.aget_active_account()
         
         # 如果启用了代理IP池，则获取一个代理IP
         if self.proxy_ip_pool:
             ip_info = await self.proxy_ip_pool.get_proxy()
             utils.logger.info(
-                f"[AccountWithIpPoolManager.get_account_with_ip] enable proxy ip pool, get proxy ip: {ip_info}"
+                "[AccountWithIpPoolManager.get_account_with_ip] enable proxy ip pool, get proxy ip: {}:{}",
+                ip_info.ip if ip_info else None, ip_info.port if ip_info else None,
             )
         
         return AccountWithIpModel(account=account, ip_info=ip_info)
@@ -5,13 +5,29 @@
 用于发送HTTP请求到目标网站
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import AsyncIterator, Dict, Optional
 
 import httpx
 
+try:
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # 创建日志记录器
 logger = logging.getLogger(__name__)
 
+# 连接池配置：复用 keep-alive 连接，避免每个请求重新进行 TCP/TLS 握手
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0, pool=5.0)
+
 
 class AsyncHTTPClient:
     """
@@ -21,21 +37,74 @@ class AsyncHTTPClient:
     设计思路：
     1. 使用httpx库实现异步HTTP请求
     2. 支持上下文管理器（async with），自动管理资源
-    3. 提供GET和POST方法，简化常用请求
+    3. 提供GET和POST方法，简化常用请求；stream方法支持流式读取响应体
+    4. 提供进程内共享的客户端（get_shared），复用连接池
     """
+
+    # 共享客户端：base_url -> 客户端实例
+    _shared_clients: Dict[str, "AsyncHTTPClient"] = {}
+    # 在首次使用时于运行中的事件循环内创建
+    _shared_lock: Optional[asyncio.Lock] = None
     
-    def __init__(self, base_url: str = ""):
+    def __init__(self, base_url: str = "", cookies: Optional[CookieJar] = None):
         """
         初始化HTTP客户端
         
         Args:
             base_url: 基础URL，如果设置了，后续请求会自动拼接此URL
+            cookies: 客户端使用的Cookie容器，默认为httpx的普通Cookie容器
         """
-        # 创建httpx异步客户端
-        self.client = httpx.AsyncClient()
+        # 创建httpx异步客户端（基础URL交给httpx拼接，安装了h2时启用HTTP/2）
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=DEFAULT_LIMITS,
+            timeout=DEFAULT_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+            cookies=cookies,
+        )
         # 保存基础URL
         self.base_uri = base_url
 
+    @classmethod
+    async def get_shared(cls, base_url: str = "") -> "AsyncHTTPClient":
+        """
+        获取进程内共享的HTTP客户端（按base_url区分），首次调用时创建
+        共享客户端不保存响应中的Cookie，避免不同调用方之间互相影响
+        不要对共享客户端使用 async with，统一由 close_shared 关闭
+        
+        Args:
+            base_url: 基础URL
+            
+        Returns:
+            AsyncHTTPClient: 共享的HTTP客户端
+        """
+        client = cls._shared_clients.get(base_url)
+        if client:
+            return client
+
+        if cls._shared_lock is None:
+            cls._shared_lock = asyncio.Lock()
+        async with cls._shared_lock:
+            client = cls._shared_clients.get(base_url)
+            if not client:
+                client = cls(
+                    base_url=base_url,
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                )
+                cls._shared_clients[base_url] = client
+            return client
+
+    @classmethod
+    async def close_shared(cls):
+        """
+        关闭所有共享的HTTP客户端
+        在爬虫退出清理资源时调用
+        """
+        clients = list(cls._shared_clients.values())
+        cls._shared_clients.clear()
+        for client in clients:
+            await client.close()
+
     async def __aenter__(self):
         """
         异步上下文管理器入口
@@ -73,21 +142,43 @@ class AsyncHTTPClient:
         Raises:
             Exception: 请求失败时抛出异常
         """
-        # 如果有基础URL，则拼接
-        if self.base_uri:
-            url = self.base_uri + url
-            
-        logger.info(f"Request started: {method} {url}, kwargs:{kwargs}")
+        # 使用%参数延迟格式化，日志级别关闭时不拼接字符串；只记录参数名，避免输出大体积的请求头/请求体
+        logger.debug("Request started: %s %s kwargs=%s", method, url, list(kwargs))
         
         try:
             # 发送HTTP请求
             response = await self.client.request(method, url, **kwargs)
-            logger.info(f"Request completed with status {response.status_code}")
+            logger.info("Request completed: %s %s %s", method, url, response.status_code)
             return response
         except Exception as e:
-            logger.error(f"Request failed: {str(e)}")
+            logger.error("Request failed: %s %s %s", method, url, e)
             raise
 
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        以流式方式执行HTTP请求
+        响应体不会预先整体读入内存，调用方可以只读取状态码/响应头，或通过
+        `async for chunk in response.aiter_bytes()` 边下载边处理
+        
+        使用方式：
+            async with client.stream("GET", url) as response:
+                async for chunk in response.aiter_bytes():
+                    ...
+        
+        Args:
+            method: HTTP方法（GET、POST等）
+            url: 请求的URL
+            **kwargs: 其他请求参数（headers、params、json等）
+            
+        Yields:
+            httpx.Response: 尚未读取响应体的HTTP响应对象，退出上下文时关闭
+        """
+        logger.debug("Stream request started: %s %s kwargs=%s", method, url, list(kwargs))
+        async with self.client.stream(method, url, **kwargs) as response:
+            logger.info("Stream response received: %s %s %s", method, url, response.status_code)
+            yield response
+
     async def get(self, url: str, **kwargs):
         """
         发送GET请求
@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class AbstractCache(ABC):
@@ -15,13 +15,13 @@ class AbstractCache(ABC):
     
     设计思路：
     1. 使用抽象基类确保所有缓存实现都有统一的接口
-    2. 支持键值对的存储、获取、删除
+    2. 支持键值对的存储、获取、删除，接口均为协程，避免阻塞事件循环
     3. 支持过期时间设置
     4. 支持模式匹配查找键
     """
     
     @abstractmethod
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """
         从缓存中获取键的值
         
@@ -34,7 +34,7 @@ class AbstractCache(ABC):
         raise NotImplementedError("子类必须实现 get 方法")
 
     @abstractmethod
-    def set(self, key: str, value: Any, expire_time: int) -> None:
+    async def set(self, key: str, value: Any, expire_time: int) -> None:
         """
         将键的值设置到缓存中
         
@@ -46,7 +46,7 @@ class AbstractCache(ABC):
         raise NotImplementedError("子类必须实现 set 方法")
 
     @abstractmethod
-    def delete(self, key: str) -> None:
+    async def delete(self, key: str) -> None:
         """
         删除缓存键
         
@@ -56,7 +56,7 @@ class AbstractCache(ABC):
         raise NotImplementedError("子类必须实现 delete 方法")
 
     @abstractmethod
-    def keys(self, pattern: str) -> List[str]:
+    async def keys(self, pattern: str) -> List[str]:
         """
         获取所有符合pattern的键
         
@@ -69,7 +69,7 @@ class AbstractCache(ABC):
         raise NotImplementedError("子类必须实现 keys 方法")
 
     @abstractmethod
-    def ttl(self, key: str) -> int:
+    async def ttl(self, key: str) -> int:
         """
         获取键的剩余生存时间（秒）
         
@@ -80,3 +80,28 @@ class AbstractCache(ABC):
             int: 剩余生存时间（秒），-1表示永不过期，-2表示键不存在
         """
         raise NotImplementedError("子类必须实现 ttl 方法")
+
+    async def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        批量获取多个键的值
+        默认逐个调用 get，子类可覆盖为批量实现
+        
+        Args:
+            keys: 缓存键列表
+            
+        Returns:
+            Dict[str, Any]: 键到缓存值的映射，不存在或已过期的键值为None
+        """
+        return {key: await self.get(key) for key in keys}
+
+    async def mset(self, mapping: Dict[str, Any], expire_time: int) -> None:
+        """
+        批量设置多个键的值
+        默认逐个调用 set，子类可覆盖为批量实现
+        
+        Args:
+            mapping: 键到缓存值的映射
+            expire_time: 过期时间（秒）
+        """
+        for key, value in mapping.items():
+            await self.set(key, value, expire_time)
@@ -4,6 +4,15 @@
 根据配置创建不同类型的缓存实例（本地缓存或Redis缓存）
 """
 
+from .local_cache import ExpiringLocalCache
+from .redis_cache import RedisCache
+
+# 缓存类型 -> 缓存类
+_CACHE_TYPES = {
+    'memory': ExpiringLocalCache,
+    'redis': RedisCache,
+}
+
 
 class CacheFactory:
     """
@@ -32,13 +41,7 @@ class CacheFactory:
         Raises:
             ValueError: 如果缓存类型未知
         """
-        if cache_type == 'memory':
-            # 导入本地缓存类
-            from .local_cache import ExpiringLocalCache
-            return ExpiringLocalCache(*args, **kwargs)
-        elif cache_type == 'redis':
-            # 导入Redis缓存类
-            from .redis_cache import RedisCache
-            return RedisCache()
-        else:
+        cache_cls = _CACHE_TYPES.get(cache_type)
+        if cache_cls is None:
             raise ValueError(f'Unknown cache type: {cache_type}')
+        return cache_cls(*args, **kwargs)
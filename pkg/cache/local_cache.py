@@ -5,57 +5,81 @@
 """
 
 import asyncio
+import fnmatch
+import functools
+import heapq
+import re
 import time
+import weakref
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Tuple
 
 from .abs_cache import AbstractCache
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """
+    将通配符模式编译为正则表达式（结果缓存，同一模式只编译一次）
+    
+    Args:
+        pattern: 通配符模式，支持'*'、'?'、'[...]'
+        
+    Returns:
+        re.Pattern: 编译后的正则表达式
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
 class ExpiringLocalCache(AbstractCache):
     """
     带过期时间的本地缓存
     使用内存字典存储数据，支持自动过期清理
     
     设计思路：
-    1. 使用字典存储键值对，值包含数据和过期时间
-    2. 后台任务定期清理过期数据
-    3. 获取数据时检查是否过期
+    1. 使用两个并行字典分别存储值和过期时间，清理时只需遍历过期时间
+    2. 维护按过期时间排序的最小堆，后台任务定期只弹出已过期的数据
+    3. 获取数据时只检查是否过期，不在读取路径上删除
+    4. 按LRU淘汰，键数量超过容量上限时移除最久未使用的键
+    
+    使用方式：在事件循环中 await start() 开启定时清理（首次 set 时也会自动开启），
+    不再使用时 await aclose()
     """
     
-    def __init__(self, cron_interval: int = 10):
+    def __init__(self, cron_interval: int = 10, capacity: int = 10_000):
         """
         初始化本地缓存
         
         Args:
             cron_interval: 定时清理缓存的时间间隔（秒），默认10秒
+            capacity: 最多缓存的键数量，默认10000
         """
         self._cron_interval = cron_interval
-        # 缓存容器：key -> (value, expire_time)
-        self._cache_container: Dict[str, Tuple[Any, float]] = {}
+        self._capacity = capacity
+        # 缓存容器：key -> value，按最近使用顺序排列（最久未使用的在前）
+        self._values: "OrderedDict[str, Any]" = OrderedDict()
+        # 过期时间：key -> expire_time
+        self._expires: Dict[str, float] = {}
+        # 过期堆：(expire_time, key)，被覆盖或删除的键会留下过期的堆条目，清理时按过期时间校验跳过
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._cron_task: Optional[asyncio.Task] = None
-        self._loop = asyncio.get_event_loop()
-        # 开启定时清理任务
-        self._schedule_clear()
 
-    def __del__(self):
+    async def start(self) -> None:
         """
-        析构函数，清理定时任务
+        在当前运行的事件循环中开启定时清理任务
         """
-        self.stop()
+        self._schedule_clear()
 
-    def stop(self):
+    async def aclose(self) -> None:
         """
-        停止定时清理任务
+        停止定时清理任务并等待其退出
         """
         if self._cron_task is not None:
-            self._cron_task.cancel()
-            try:
-                self._loop.run_until_complete(self._cron_task)
-            except asyncio.CancelledError:
-                pass
-            self._cron_task = None
+            cron_task, self._cron_task = self._cron_task, None
+            cron_task.cancel()
+            await asyncio.gather(cron_task, return_exceptions=True)
 
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """
         从缓存中获取键的值
         
@@ -65,18 +89,18 @@ class ExpiringLocalCache(AbstractCache):
         Returns:
             Any: 缓存值，如果不存在或已过期返回None
         """
-        value, expire_time = self._cache_container.get(key, (None, 0))
-        if value is None:
+        expire_time = self._expires.get(key)
+        if expire_time is None:
             return None
 
-        # 如果键已过期，则删除键并返回None
+        # 如果键已过期，直接返回None，由定时清理任务统一删除
         if expire_time < time.time():
-            del self._cache_container[key]
             return None
 
-        return value
+        self._values.move_to_end(key)
+        return self._values[key]
 
-    def ttl(self, key: str) -> int:
+    async def ttl(self, key: str) -> int:
         """
         获取键的剩余生存时间（秒）
         
@@ -86,18 +110,18 @@ class ExpiringLocalCache(AbstractCache):
         Returns:
             int: 剩余生存时间（秒），-2表示键不存在或已过期
         """
-        value, expire_time = self._cache_container.get(key, (None, 0))
-        if value is None:
+        expire_time = self._expires.get(key)
+        if expire_time is None:
             return -2
 
-        # 如果键已过期，则删除键并返回-2
-        if expire_time < time.time():
-            del self._cache_container[key]
+        # 如果键已过期，直接返回-2，由定时清理任务统一删除
+        now = time.time()
+        if expire_time < now:
             return -2
 
-        return int(expire_time - time.time())
+        return int(expire_time - now)
 
-    def set(self, key: str, value: Any, expire_time: int) -> None:
+    async def set(self, key: str, value: Any, expire_time: int) -> None:
         """
         将键的值设置到缓存中
         
@@ -107,69 +131,86 @@ class ExpiringLocalCache(AbstractCache):
             expire_time: 过期时间（秒）
         """
         # 存储值和过期时间（当前时间 + 过期时间）
-        self._cache_container[key] = (value, time.time() + expire_time)
-
-    def delete(self, key: str) -> None:
+        self._schedule_clear()
+        expire_ts = time.time() + expire_time
+        if key in self._values:
+            self._values.move_to_end(key)
+        elif len(self._values) >= self._capacity:
+            # 超过容量上限，淘汰最久未使用的键（其堆条目清理时会被跳过）
+            evicted_key, _ = self._values.popitem(last=False)
+            del self._expires[evicted_key]
+        self._values[key] = value
+        self._expires[key] = expire_ts
+        heapq.heappush(self._expiry_heap, (expire_ts, key))
+
+    async def delete(self, key: str) -> None:
         """
         删除缓存键
         
         Args:
             key: 缓存键
         """
-        if key in self._cache_container:
-            del self._cache_container[key]
+        if key in self._expires:
+            del self._values[key]
+            del self._expires[key]
 
-    def keys(self, pattern: str) -> List[str]:
+    async def keys(self, pattern: str) -> List[str]:
         """
         获取所有符合pattern的键
         
         Args:
-            pattern: 匹配模式，支持'*'通配符
+            pattern: 匹配模式，支持'*'、'?'、'[...]'通配符（与Redis KEYS一致，区分大小写）
             
         Returns:
             List[str]: 匹配的键列表
         """
         if pattern == '*':
-            return list(self._cache_container.keys())
+            return list(self._values.keys())
 
-        # 本地缓存通配符暂时将*替换为空
-        if '*' in pattern:
-            pattern = pattern.replace('*', '')
-
-        return [key for key in self._cache_container.keys() if pattern in key]
+        match = _compile_pattern(pattern).match
+        return [key for key in self._values.keys() if match(key)]
 
     def _schedule_clear(self):
         """
-        开启定时清理任务
+        开启定时清理任务（已开启时不重复创建）
+        必须在运行中的事件循环内调用
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        self._cron_task = loop.create_task(self._start_clear_cron())
+        if self._cron_task is not None and not self._cron_task.done():
+            return
+        # 定时任务只持有缓存的弱引用，缓存被回收时任务随之取消，不会让任务一直引用整个缓存
+        self._cron_task = asyncio.get_running_loop().create_task(
+            self._start_clear_cron(weakref.ref(self), self._cron_interval)
+        )
+        weakref.finalize(self, self._cron_task.cancel)
 
     def _clear(self):
         """
         根据过期时间清理缓存
-        删除所有已过期的键
+        从过期堆中弹出所有已过期的键并删除
         """
         current_time = time.time()
-        # 收集需要删除的键
-        keys_to_delete = [
-            key for key, (value, expire_time) in self._cache_container.items()
-            if expire_time < current_time
-        ]
-        # 删除过期的键
-        for key in keys_to_delete:
-            del self._cache_container[key]
+        heap = self._expiry_heap
+        while heap and heap[0][0] < current_time:
+            expire_time, key = heapq.heappop(heap)
+            # 键已被覆盖或删除时，堆条目与当前过期时间不一致，直接跳过
+            if self._expires.get(key) == expire_time:
+                del self._values[key]
+                del self._expires[key]
 
-    async def _start_clear_cron(self):
+    @staticmethod
+    async def _start_clear_cron(cache_ref: "weakref.ref", cron_interval: int):
         """
         开启定时清理任务（异步）
-        每隔指定时间清理一次过期数据
+        每隔指定时间清理一次过期数据，缓存被回收后退出
+        
+        Args:
+            cache_ref: 缓存实例的弱引用
+            cron_interval: 清理间隔（秒）
         """
         while True:
-            self._clear()
-            await asyncio.sleep(self._cron_interval)
+            cache = cache_ref()
+            if cache is None:
+                return
+            cache._clear()
+            del cache
+            await asyncio.sleep(cron_interval)
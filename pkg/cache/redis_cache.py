@@ -4,14 +4,17 @@ Redis缓存实现
 使用Redis作为缓存后端，支持分布式缓存
 """
 
-import pickle
-from typing import Any, List
+from typing import Any, Dict, List
 
-from redis import Redis
+import orjson
+from redis.asyncio import BlockingConnectionPool, Redis
 
 import config
 from .abs_cache import AbstractCache
 
+# Redis连接池最大连接数
+REDIS_MAX_CONNECTIONS = 50
+
 
 class RedisCache(AbstractCache):
     """
@@ -20,9 +23,10 @@ class RedisCache(AbstractCache):
     
     设计思路：
     1. 使用Redis存储缓存数据
-    2. 使用pickle序列化/反序列化数据
-    3. 支持过期时间设置
-    4. 支持模式匹配查找键
+    2. 使用redis.asyncio客户端，缓存操作不阻塞事件循环
+    3. 使用orjson序列化/反序列化数据（值需为JSON可序列化的dict/list/str/数字等）
+    4. 支持过期时间设置
+    5. 支持模式匹配查找键
     """
     
     def __init__(self) -> None:
@@ -36,20 +40,23 @@ class RedisCache(AbstractCache):
     @staticmethod
     def _connect_redis() -> Redis:
         """
-        连接Redis，返回Redis客户端
+        连接Redis，返回异步Redis客户端
+        连接池满时等待空闲连接，而不是报错
         
         Returns:
-            Redis: Redis客户端实例
+            Redis: 异步Redis客户端实例
         """
-        return Redis(
+        connection_pool = BlockingConnectionPool(
             host=config.REDIS_DB_HOST,
             port=config.REDIS_DB_PORT,
             db=config.REDIS_DB_NUM,
             password=config.REDIS_DB_PWD,
-            decode_responses=False  # 不自动解码，使用pickle序列化
+            max_connections=REDIS_MAX_CONNECTIONS,
+            decode_responses=False  # 不自动解码，值为orjson序列化后的bytes
         )
+        return Redis(connection_pool=connection_pool)
 
-    def get(self, key: str) -> Any:
+    async def get(self, key: str) -> Any:
         """
         从缓存中获取键的值，并反序列化
         
@@ -59,13 +66,13 @@ class RedisCache(AbstractCache):
         Returns:
             Any: 缓存值，如果不存在返回None
         """
-        value = self._redis_client.get(key)
+        value = await self._redis_client.get(key)
         if value is None:
             return None
-        # 使用pickle反序列化
-        return pickle.loads(value)
+        # 使用orjson反序列化
+        return orjson.loads(value)
 
-    def set(self, key: str, value: Any, expire_time: int) -> None:
+    async def set(self, key: str, value: Any, expire_time: int) -> None:
         """
         将键的值设置到缓存中，并序列化
         
@@ -74,19 +81,51 @@ class RedisCache(AbstractCache):
             value: 缓存值
             expire_time: 过期时间（秒）
         """
-        # 使用pickle序列化，并设置过期时间
-        self._redis_client.set(key, pickle.dumps(value), ex=expire_time)
+        # 使用orjson序列化，并设置过期时间
+        await self._redis_client.set(key, orjson.dumps(value), ex=expire_time)
+
+    async def mget(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        批量获取多个键的值，通过pipeline一次往返完成
+        
+        Args:
+            keys: 缓存键列表
+            
+        Returns:
+            Dict[str, Any]: 键到缓存值的映射，不存在的键值为None
+        """
+        pipe = self._redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+        values = await pipe.execute()
+        return {
+            key: orjson.loads(value) if value is not None else None
+            for key, value in zip(keys, values)
+        }
+
+    async def mset(self, mapping: Dict[str, Any], expire_time: int) -> None:
+        """
+        批量设置多个键的值，通过pipeline一次往返完成
+        
+        Args:
+            mapping: 键到缓存值的映射
+            expire_time: 过期时间（秒）
+        """
+        pipe = self._redis_client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(key, orjson.dumps(value), ex=expire_time)
+        await pipe.execute()
 
-    def delete(self, key: str) -> None:
+    async def delete(self, key: str) -> None:
         """
         删除缓存键
         
         Args:
             key: 缓存键
         """
-        self._redis_client.delete(key)
+        await self._redis_client.delete(key)
 
-    def keys(self, pattern: str) -> List[str]:
+    async def keys(self, pattern: str) -> List[str]:
         """
         获取所有符合pattern的键
         
@@ -97,9 +136,9 @@ class RedisCache(AbstractCache):
             List[str]: 匹配的键列表
         """
         # Redis返回的是bytes类型，需要解码
-        return [key.decode() for key in self._redis_client.keys(pattern)]
+        return [key.decode() for key in await self._redis_client.keys(pattern)]
 
-    def ttl(self, key: str) -> int:
+    async def ttl(self, key: str) -> int:
         """
         获取键的剩余生存时间（秒）
         
@@ -109,4 +148,4 @@ class RedisCache(AbstractCache):
         Returns:
             int: 剩余生存时间（秒），-1表示永不过期，-2表示键不存在
         """
-        return self._redis_client.ttl(key)
+        return await self._redis_client.ttl(key)
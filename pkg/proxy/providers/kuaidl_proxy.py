@@ -5,12 +5,11 @@
 """
 
 import re
-from typing import List
-
-import httpx
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+from typing import List, NamedTuple
 
 import config
+from pkg.async_http_client import AsyncHTTPClient
 from pkg.proxy.base_proxy import ProxyProvider
 from pkg.proxy.types import IpInfoModel, ProviderNameEnum
 from pkg.tools import utils
@@ -19,40 +18,49 @@ from pkg.tools import utils
 DELTA_EXPIRED_SECOND = 5
 
 
-class KuaidailiProxyModel(BaseModel):
+class KuaidailiProxyModel(NamedTuple):
     """
-    快代理IP信息模型
+    快代理IP信息
+    只有三个字段且来源固定，使用NamedTuple避免pydantic校验开销
     """
-    ip: str = Field(title="IP地址")
-    port: int = Field(title="端口")
-    expire_ts: int = Field(title="过期时间，单位秒，多少秒后过期")
+    ip: str  # IP地址
+    port: int  # 端口
+    expire_ts: int  # 过期时间，单位秒，多少秒后过期
+
+
+# 快代理IP信息格式：ip:port,expire_ts（仅用于快速路径解析失败时的兜底）
+_PROXY_INFO_RE = re.compile(r'(\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5}),(\d+)\Z')
 
 
 def parse_kuaidaili_proxy(proxy_info: str) -> KuaidailiProxyModel:
     """
     解析快代理的IP信息
     格式：ip:port,expire_ts
+    优先使用 str.split 解析，格式不规范时回退到正则表达式
     
     Args:
         proxy_info: 快代理返回的IP信息字符串
         
     Returns:
-        KuaidailiProxyModel: 解析后的IP信息模型
+        KuaidailiProxyModel: 解析后的IP信息
         
     Raises:
         Exception: 如果解析失败
     """
-    # 使用正则表达式解析IP信息
-    pattern = r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}):(\d{1,5}),(\d+)'
-    match = re.search(pattern, proxy_info)
-    if not match or not match.groups():
+    try:
+        ip_port, expire_ts = proxy_info.strip().split(',')
+        ip, port = ip_port.rsplit(':', 1)
+        return KuaidailiProxyModel(ip=ip, port=int(port), expire_ts=int(expire_ts))
+    except ValueError:
+        pass
+
+    # 使用正则表达式从开头完整匹配IP信息
+    match = _PROXY_INFO_RE.match(proxy_info.strip())
+    if not match:
         raise Exception("not match kuaidaili proxy info")
 
-    return KuaidailiProxyModel(
-        ip=match.groups()[0],
-        port=int(match.groups()[1]),
-        expire_ts=int(match.groups()[2])
-    )
+    ip, port, expire_ts = match.groups()
+    return KuaidailiProxyModel(ip=ip, port=int(port), expire_ts=int(expire_ts))
 
 
 class KuaiDaiLiProxy(ProxyProvider):
@@ -84,15 +92,15 @@ class KuaiDaiLiProxy(ProxyProvider):
         self.signature = kdl_signature
         self.proxy_brand_name = ProviderNameEnum.KUAI_DAILI_PROVIDER.value
         
-        # API请求参数
-        self.params = {
+        # API请求的基础参数（只读，每次请求在此基础上构造新的参数字典）
+        self._base_params = MappingProxyType({
             "secret_id": self.secret_id,
             "signature": self.signature,
             "pt": 1,  # 代理类型：1-私密代理
             "format": "json",  # 返回格式
             "sep": 1,  # 分隔符
             "f_et": 1,  # 返回过期时间
-        }
+        })
 
     async def get_proxies(self, num: int) -> List[IpInfoModel]:
         """
@@ -108,37 +116,39 @@ class KuaiDaiLiProxy(ProxyProvider):
             Exception: 如果获取失败
         """
         uri = "/api/getdps/"
-        self.params.update({"num": num})
+        # 基础参数只读，并发重新加载时不会互相覆盖 num
+        params = {**self._base_params, "num": num}
 
         ip_infos: List[IpInfoModel] = []
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.api_base + uri, params=self.params)
-
-            if response.status_code != 200:
-                utils.logger.error(
-                    f"[KuaiDaiLiProxy.get_proxies] status code not 200 and response.txt:{response.text}"
-                )
-                raise Exception("get ip error from proxy provider and status code not 200 ...")
-
-            ip_response = response.json()
-            if ip_response.get("code") != 0:
-                utils.logger.error(
-                    f"[KuaiDaiLiProxy.get_proxies] code not 0 and msg:{ip_response.get('msg')}"
-                )
-                raise Exception("get ip error from proxy provider and code not 0 ...")
-
-            proxy_list: List[str] = ip_response.get("data", {}).get("proxy_list", [])
-            for proxy in proxy_list:
-                proxy_model = parse_kuaidaili_proxy(proxy)
-                ip_info_model = IpInfoModel(
-                    ip=proxy_model.ip,
-                    port=proxy_model.port,
-                    user=self.kdl_user_name,
-                    password=self.kdl_user_pwd,
-                    # 计算过期时间戳（当前时间 + 过期秒数 - 提前量）
-                    expired_time_ts=proxy_model.expire_ts + utils.get_unix_timestamp() - DELTA_EXPIRED_SECOND,
-                )
-                ip_infos.append(ip_info_model)
+        # 使用以快代理API为基础URL的共享客户端，多次加载复用同一连接
+        client = await AsyncHTTPClient.get_shared(self.api_base)
+        response = await client.get(uri, params=params)
+
+        if response.status_code != 200:
+            utils.logger.error(
+                f"[KuaiDaiLiProxy.get_proxies] status code not 200 and response.txt:{response.text}"
+            )
+            raise Exception("get ip error from proxy provider and status code not 200 ...")
+
+        ip_response = response.json()
+        if ip_response.get("code") != 0:
+            utils.logger.error(
+                f"[KuaiDaiLiProxy.get_proxies] code not 0 and msg:{ip_response.get('msg')}"
+            )
+            raise Exception("get ip error from proxy provider and code not 0 ...")
+
+        proxy_list: List[str] = ip_response.get("data", {}).get("proxy_list", [])
+        for proxy in proxy_list:
+            proxy_model = parse_kuaidaili_proxy(proxy)
+            ip_info_model = IpInfoModel(
+                ip=proxy_model.ip,
+                port=proxy_model.port,
+                user=self.kdl_user_name,
+                password=self.kdl_user_pwd,
+                # 计算过期时间戳（当前时间 + 过期秒数 - 提前量）
+                expired_time_ts=proxy_model.expire_ts + utils.get_unix_timestamp() - DELTA_EXPIRED_SECOND,
+            )
+            ip_infos.append(ip_info_model)
 
         return ip_infos
 
@@ -4,19 +4,26 @@
 管理代理IP的获取、验证、轮换等功能
 """
 
+import asyncio
 import random
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_fixed
 
 import config
+from pkg.async_http_client import HTTP2_AVAILABLE
 from pkg.proxy.providers import new_kuai_daili_proxy
 from pkg.tools import utils
 
 from .base_proxy import ProxyProvider
 from .types import IpInfoModel, ProviderNameEnum
 
+# 代理验证客户端的最大缓存数量
+VALIDATOR_CLIENT_CACHE_SIZE = 64
+# get_proxy 最多尝试提取IP的次数
+GET_PROXY_MAX_ATTEMPTS = 3
+
 
 class ProxyIpPool:
     """
@@ -45,14 +52,81 @@ class ProxyIpPool:
         self.ip_pool_count = ip_pool_count
         self.enable_validate_ip = enable_validate_ip
         self.proxy_list: List[IpInfoModel] = []
+        # 代理标识 -> 在 proxy_list 中的下标，标记失效/取出时 O(1) 定位并移除
+        self._proxy_index: Dict[Tuple, int] = {}
         self.ip_provider: ProxyProvider = ip_provider
+        # 按代理URL缓存的验证客户端（LRU），重复验证同一代理时复用连接
+        self._validator_clients: "OrderedDict[str, httpx.AsyncClient]" = OrderedDict()
 
     async def load_proxies(self) -> None:
         """
         加载IP代理
         从代理IP提供商获取指定数量的IP
         """
-        self.proxy_list = await self.ip_provider.get_proxies(self.ip_pool_count)
+        self._set_proxies(await self.ip_provider.get_proxies(self.ip_pool_count))
+        # 启用验证时加载后并发验证整批IP，get_proxy 只需直接取用
+        if self.enable_validate_ip:
+            await self._validate_all()
+
+    async def _validate_all(self) -> None:
+        """
+        并发验证代理池中的所有IP，只保留有效的IP
+        """
+        results = await asyncio.gather(
+            *[self._is_valid_proxy(proxy) for proxy in self.proxy_list],
+            return_exceptions=True,
+        )
+        self._set_proxies(
+            [proxy for proxy, is_valid in zip(self.proxy_list, results) if is_valid is True]
+        )
+        utils.logger.info(
+            f"[ProxyIpPool._validate_all] {len(self.proxy_list)}/{len(results)} proxy ips are valid"
+        )
+
+    @staticmethod
+    def _proxy_key(proxy: IpInfoModel) -> Tuple:
+        """
+        获取代理IP的唯一标识
+        
+        Args:
+            proxy: 代理IP信息模型
+            
+        Returns:
+            Tuple: (ip, port, protocol, user, password)
+        """
+        return proxy.ip, proxy.port, proxy.protocol, proxy.user, proxy.password
+
+    def _set_proxies(self, proxies: List[IpInfoModel]) -> None:
+        """
+        替换代理池中的IP并重建下标索引（重复的IP只保留一个）
+        
+        Args:
+            proxies: 代理IP列表
+        """
+        unique_proxies = {self._proxy_key(proxy): proxy for proxy in proxies}
+        self.proxy_list = list(unique_proxies.values())
+        self._proxy_index = {key: index for index, key in enumerate(unique_proxies)}
+
+    def _remove_proxy(self, key: Tuple) -> Optional[IpInfoModel]:
+        """
+        从代理池中移除指定IP
+        将列表末尾的IP移到被移除的位置，避免列表元素整体移动
+        
+        Args:
+            key: 代理IP的唯一标识
+            
+        Returns:
+            Optional[IpInfoModel]: 被移除的IP，不在代理池中时返回None
+        """
+        index = self._proxy_index.pop(key, None)
+        if index is None:
+            return None
+        proxy = self.proxy_list[index]
+        last_proxy = self.proxy_list.pop()
+        if index < len(self.proxy_list):
+            self.proxy_list[index] = last_proxy
+            self._proxy_index[self._proxy_key(last_proxy)] = index
+        return proxy
 
     async def _is_valid_proxy(self, proxy: IpInfoModel) -> bool:
         """
@@ -71,9 +145,8 @@ class ProxyIpPool:
         try:
             # 格式化代理URL
             httpx_proxy = f"http://{proxy.user}:{proxy.password}@{proxy.ip}:{proxy.port}"
-            # httpx 0.28.0 可以直接使用 proxy 参数
-            async with httpx.AsyncClient(proxy=httpx_proxy, timeout=10) as client:
-                response = await client.get(self.valid_ip_url)
+            client = await self._get_validator_client(httpx_proxy)
+            response = await client.get(self.valid_ip_url)
             if response.status_code == 200:
                 return True
             else:
@@ -84,6 +157,44 @@ class ProxyIpPool:
             )
             return False
 
+    async def _get_validator_client(self, httpx_proxy: str) -> httpx.AsyncClient:
+        """
+        获取指定代理的验证客户端，不存在时创建
+        超过缓存上限时关闭并移除最久未使用的客户端
+        
+        Args:
+            httpx_proxy: 代理URL
+            
+        Returns:
+            httpx.AsyncClient: 通过该代理发送请求的客户端
+        """
+        client = self._validator_clients.get(httpx_proxy)
+        if client is not None:
+            self._validator_clients.move_to_end(httpx_proxy)
+            return client
+
+        # httpx 0.28.0 可以直接使用 proxy 参数
+        client = httpx.AsyncClient(
+            proxy=httpx_proxy,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=4),
+            http2=HTTP2_AVAILABLE,
+        )
+        self._validator_clients[httpx_proxy] = client
+        if len(self._validator_clients) > VALIDATOR_CLIENT_CACHE_SIZE:
+            _, evicted_client = self._validator_clients.popitem(last=False)
+            await evicted_client.aclose()
+        return client
+
+    async def close(self):
+        """
+        关闭所有缓存的验证客户端
+        """
+        clients = list(self._validator_clients.values())
+        self._validator_clients.clear()
+        for client in clients:
+            await client.aclose()
+
     async def mark_ip_invalid(self, proxy: IpInfoModel):
         """
         标记IP为无效
@@ -96,53 +207,44 @@ class ProxyIpPool:
         # 通知提供商标记IP为无效
         self.ip_provider.mark_ip_invalid(proxy)
         # 从代理池中移除该IP
-        for p in self.proxy_list:
-            if (
-                p.ip == proxy.ip
-                and p.port == proxy.port
-                and p.protocol == proxy.protocol
-                and p.user == proxy.user
-                and p.password == proxy.password
-            ):
-                self.proxy_list.remove(p)
-                break
+        self._remove_proxy(self._proxy_key(proxy))
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
     async def get_proxy(self) -> IpInfoModel:
         """
         从代理池中随机提取一个代理IP
-        如果代理池为空，则重新加载
-        如果启用了验证，则验证IP是否有效
+        如果代理池为空，则重新加载（启用验证时加载后已批量验证）
         
         Returns:
             IpInfoModel: 代理IP信息模型
             
         Raises:
-            Exception: 如果IP无效且重试失败
+            Exception: 如果多次尝试后仍没有可用的IP
         """
-        # 如果代理池为空，重新加载
-        if len(self.proxy_list) == 0:
-            await self._reload_proxies()
+        # 不等待，每次尝试立即换一个IP
+        for _ in range(GET_PROXY_MAX_ATTEMPTS):
+            # 如果代理池为空，重新加载
+            if len(self.proxy_list) == 0:
+                await self._reload_proxies()
+            if len(self.proxy_list) == 0:
+                break
 
-        # 随机选择一个IP
-        proxy = random.choice(self.proxy_list)
-        # 从列表中移除（避免重复使用）
-        self.proxy_list.remove(proxy)
-        
-        # 如果启用了验证，验证IP是否有效
-        if self.enable_validate_ip:
-            if not await self._is_valid_proxy(proxy):
-                raise Exception(
-                    "[ProxyIpPool.get_proxy] current ip invalid and again get it"
-                )
-        return proxy
+            # 随机选择一个IP并从代理池中移除（避免重复使用）
+            proxy = random.choice(self.proxy_list)
+            self._remove_proxy(self._proxy_key(proxy))
+
+            # 跳过已过期的IP
+            if not proxy.is_expired:
+                return proxy
+            utils.logger.info(f"[ProxyIpPool.get_proxy] proxy {proxy.ip} expired, try another")
+
+        raise Exception("[ProxyIpPool.get_proxy] no valid proxy ip in pool")
 
     async def _reload_proxies(self):
         """
         重新加载代理池
         清空当前代理列表，重新从提供商获取
         """
-        self.proxy_list = []
+        self._set_proxies([])
         await self.load_proxies()
 
 
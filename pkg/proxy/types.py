@@ -5,10 +5,9 @@
 """
 
 import time
+from dataclasses import dataclass, field
 from enum import Enum
 
-from pydantic import BaseModel, Field
-
 
 class ProviderNameEnum(Enum):
     """
@@ -17,17 +16,19 @@ class ProviderNameEnum(Enum):
     KUAI_DAILI_PROVIDER: str = "kuaidaili"  # 快代理
 
 
-class IpInfoModel(BaseModel):
+@dataclass(frozen=True)
+class IpInfoModel:
     """
     统一的IP信息模型
     存储代理IP的所有信息，包括IP、端口、认证信息、过期时间等
+    数据来自代理提供商且类型已确定，使用不可变dataclass避免pydantic校验开销
     """
-    ip: str = Field(title="代理IP地址")
-    port: int = Field(title="代理端口")
-    user: str = Field(title="IP代理认证的用户名")
-    protocol: str = Field(default="https://", title="代理IP的协议")
-    password: str = Field(title="IP代理认证用户的密码")
-    expired_time_ts: int = Field(title="IP过期时间时间戳，单位秒")
+    ip: str  # 代理IP地址
+    port: int  # 代理端口
+    user: str  # IP代理认证的用户名
+    password: str = field(repr=False)  # IP代理认证用户的密码（不出现在日志中）
+    expired_time_ts: int  # IP过期时间时间戳，单位秒
+    protocol: str = "https://"  # 代理IP的协议
 
     def format_httpx_proxy(self) -> str:
         """
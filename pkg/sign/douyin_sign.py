@@ -4,11 +4,23 @@
 提供抖音请求签名的实现，支持Playwright和JavaScript两种方式
 """
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from importlib.resources import files
+from typing import Optional, Tuple
 
 import execjs
-from tenacity import RetryError, retry, stop_after_attempt, wait_fixed
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from pkg.sign.sign_model import DouyinSignRequest, DouyinSignResponse
 from pkg.tools import utils
@@ -17,6 +29,24 @@ from pkg.tools import utils
 DOUYIN_JAVASCRIPT_SIGN = "javascript"
 DOUYIN_PLAYWRIGHT_SIGN = "playwright"
 
+# 执行JavaScript签名的线程数（每次签名都会启动一个JS运行时子进程）
+SIGN_EXECUTOR_MAX_WORKERS = 8
+# 签名结果缓存：相同 (query_params, user_agent) 在有效期内复用签名，避免重复启动JS运行时
+SIGN_CACHE_MAX_SIZE = 4096
+SIGN_CACHE_TTL = 60  # 秒
+
+# 签名重试策略：最多3次，指数退避并加随机抖动，避免大量失败的签名同时重试
+# 只重试JS执行/运行时错误，其他异常（如不支持的签名方式）直接抛出
+# NotImplementedError 是 RuntimeError 的子类，需要单独排除
+sign_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.2, max=2.0),
+    retry=(
+        retry_if_exception_type((execjs.Error, RuntimeError, OSError))
+        & retry_if_not_exception_type(NotImplementedError)
+    ),
+)
+
 
 class AbstractDouyinSign(ABC):
     """
@@ -40,11 +70,17 @@ class AbstractDouyinSign(ABC):
         """
         raise NotImplementedError("子类必须实现 sign 方法")
 
+    def close(self) -> None:
+        """
+        释放签名器占用的资源，默认无需处理
+        """
+
 
 class DouyinJavascriptSign(AbstractDouyinSign):
     """
     抖音JavaScript签名实现
     通过执行JavaScript代码生成签名
+    execjs调用是同步阻塞的，放到线程池中执行，避免阻塞事件循环
     """
     
     def __init__(self):
@@ -52,32 +88,16 @@ class DouyinJavascriptSign(AbstractDouyinSign):
         初始化JavaScript签名器
         加载并编译JavaScript签名代码
         """
-        # 获取项目根目录（pkg/sign/douyin_sign.py -> pkg -> 项目根目录）
-        project_root = Path(__file__).parent.parent.parent
-        script_path = project_root / 'pkg' / 'js' / 'douyin.js'
-        
-        # 如果找不到文件，尝试从当前工作目录查找
-        if not script_path.exists():
-            # 尝试从当前工作目录查找
-            cwd_script_path = Path('pkg/js/douyin.js')
-            if cwd_script_path.exists():
-                script_path = cwd_script_path.resolve()
-            else:
-                # 最后尝试从当前文件位置查找
-                current_dir = Path(__file__).parent
-                script_path = current_dir.parent.parent / 'pkg' / 'js' / 'douyin.js'
-        
-        if not script_path.exists():
-            error_msg = f"[DouyinJavascriptSign] JS file not found: {script_path}"
-            utils.logger.error(error_msg)
-            raise FileNotFoundError(error_msg)
-        
+        # 通过包资源读取签名脚本（不依赖当前工作目录，打包安装后同样可用）
+        # 只读取一次字节内容，UTF-8 解码失败时再按 GBK 解码，避免重复读文件
         try:
-            script_content = script_path.read_text(encoding='utf-8')
-        except UnicodeDecodeError:
-            script_content = script_path.read_text(encoding='gbk')
+            raw = files('pkg.js').joinpath('douyin.js').read_bytes()
+            try:
+                script_content = raw.decode('utf-8')
+            except UnicodeDecodeError:
+                script_content = raw.decode('gbk')
         except Exception as e:
-            utils.logger.error(f"[DouyinJavascriptSign] Failed to load JS file {script_path}: {e}")
+            utils.logger.error(f"[DouyinJavascriptSign] Failed to load JS file pkg/js/douyin.js: {e}")
             raise
         
         # 编译JavaScript代码
@@ -88,32 +108,76 @@ class DouyinJavascriptSign(AbstractDouyinSign):
             utils.logger.error(f"[DouyinJavascriptSign] Failed to compile JS code: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(0.5))
+        # 签名线程池，首次签名时创建，close 后可再次创建
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 签名结果缓存（LRU）：(query_params, user_agent) -> (a_bogus, 过期时间)
+        self._sign_cache: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        获取签名线程池，不存在时创建
+        
+        Returns:
+            ThreadPoolExecutor: 签名线程池
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=SIGN_EXECUTOR_MAX_WORKERS, thread_name_prefix="dy-sign"
+            )
+        return self._executor
+
+    @sign_retry
     async def sign(
         self, req: DouyinSignRequest, force_init: bool = False
     ) -> DouyinSignResponse:
         """
         抖音请求签名JavaScript版本
-        如果发生异常默认重试3次，每次间隔500ms
+        JS运行时出错时最多重试3次，指数退避（0.2s起，最多2s）
+        相同参数在 SIGN_CACHE_TTL 秒内复用缓存的签名
         
         Args:
             req: 签名请求数据
-            force_init: 是否强制重新初始化（JavaScript方式不需要）
+            force_init: 是否强制重新生成签名（跳过缓存）
             
         Returns:
             DouyinSignResponse: 签名响应数据
         """
+        cache_key = (req.query_params, req.user_agent)
+        if not force_init:
+            cached = self._sign_cache.get(cache_key)
+            if cached and cached[1] > time.monotonic():
+                self._sign_cache.move_to_end(cache_key)
+                return DouyinSignResponse(a_bogus=cached[0], isok=True, msg="OK!")
+
         try:
             # 调用JavaScript函数生成a_bogus
-            a_bogus = self.douyin_sign_obj.call(
-                "get_abogus", req.query_params, "", req.user_agent
+            # 注意：douyin.js 是混淆的浏览器环境VM，同一个JS运行时内只有首次调用 get_abogus 能返回签名，
+            # 因此无法改为常驻Node进程复用；每次调用由execjs启动新的运行时。
+            # 脚本依赖Node全局环境，在嵌入式V8（py_mini_racer）或 vm 沙箱中加载会直接报错
+            # a_bogus 由脚本内的字节码VM动态生成，没有可独立移植的算法，无法改写为C/Cython扩展
+            a_bogus = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(),
+                self.douyin_sign_obj.call,
+                "get_abogus", req.query_params, "", req.user_agent,
             )
+            self._sign_cache[cache_key] = (a_bogus, time.monotonic() + SIGN_CACHE_TTL)
+            self._sign_cache.move_to_end(cache_key)
+            if len(self._sign_cache) > SIGN_CACHE_MAX_SIZE:
+                self._sign_cache.popitem(last=False)
             # 返回响应，设置a_bogus字段
             return DouyinSignResponse(a_bogus=a_bogus, isok=True, msg="OK!")
         except Exception as e:
             utils.logger.error(f"[DouyinJavascriptSign.sign] Failed to generate signature: {e}")
             raise
 
+    def close(self) -> None:
+        """
+        关闭签名线程池
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
 
 class DouyinPlaywrightSign(AbstractDouyinSign):
     """
@@ -146,13 +210,13 @@ class DouyinPlaywrightSign(AbstractDouyinSign):
             )
         return self._playwright_manager
 
-    @retry(stop=stop_after_attempt(3), wait=wait_fixed(0.5))
+    @sign_retry
     async def sign(
         self, req: DouyinSignRequest, force_init: bool = False
     ) -> DouyinSignResponse:
         """
         抖音请求签名playwright版本
-        如果发生异常默认重试3次，每次间隔500ms
+        JS运行时出错时最多重试3次，指数退避（0.2s起，最多2s）
         
         Args:
             req: 签名请求数据
@@ -169,6 +233,26 @@ class DouyinPlaywrightSign(AbstractDouyinSign):
         )
 
 
+# JavaScript签名器单例：JS文件只读取、编译一次，所有调用方共享
+_JS_SIGN_INSTANCE: Optional[DouyinJavascriptSign] = None
+_JS_SIGN_LOCK = threading.Lock()
+
+
+def _get_or_create_js_sign() -> DouyinJavascriptSign:
+    """
+    获取JavaScript签名器单例，首次调用时创建
+    
+    Returns:
+        DouyinJavascriptSign: JavaScript签名器
+    """
+    global _JS_SIGN_INSTANCE
+    if _JS_SIGN_INSTANCE is None:
+        with _JS_SIGN_LOCK:
+            if _JS_SIGN_INSTANCE is None:
+                _JS_SIGN_INSTANCE = DouyinJavascriptSign()
+    return _JS_SIGN_INSTANCE
+
+
 class DouyinSignFactory:
     """
     抖音签名工厂类
@@ -195,13 +279,34 @@ class DouyinSignFactory:
                 "falling back to JavaScript mode"
             )
             # 暂时不支持Playwright，回退到JavaScript
-            return DouyinJavascriptSign()
+            return _get_or_create_js_sign()
         elif sign_type == DOUYIN_JAVASCRIPT_SIGN:
-            return DouyinJavascriptSign()
+            return _get_or_create_js_sign()
         else:
             raise NotImplementedError(f"不支持的签名类型: {sign_type}")
 
 
+# 签名并发信号量：所有 DouyinSignLogic 共享，大小与签名线程池一致，避免大量签名请求同时排队启动JS运行时
+# Python 3.9 的 Semaphore 在创建时绑定事件循环，因此按事件循环延迟创建
+_SIGN_SEMAPHORE: Optional[asyncio.Semaphore] = None
+_SIGN_SEMAPHORE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_sign_semaphore() -> asyncio.Semaphore:
+    """
+    获取当前事件循环下共享的签名并发信号量
+    
+    Returns:
+        asyncio.Semaphore: 签名并发信号量
+    """
+    global _SIGN_SEMAPHORE, _SIGN_SEMAPHORE_LOOP
+    loop = asyncio.get_running_loop()
+    if _SIGN_SEMAPHORE is None or _SIGN_SEMAPHORE_LOOP is not loop:
+        _SIGN_SEMAPHORE = asyncio.Semaphore(SIGN_EXECUTOR_MAX_WORKERS)
+        _SIGN_SEMAPHORE_LOOP = loop
+    return _SIGN_SEMAPHORE
+
+
 class DouyinSignLogic:
     """
     抖音签名逻辑类
@@ -222,19 +327,23 @@ class DouyinSignLogic:
     async def sign(self, req_data: DouyinSignRequest) -> DouyinSignResponse:
         """
         生成签名
-        如果签名失败，会尝试强制重新初始化后重试
+        重试由签名器自身负责，这里不再叠加额外的重试
+        并发签名数受共享信号量限制（与签名线程池大小一致）
         
         Args:
             req_data: 签名请求数据
             
         Returns:
             DouyinSignResponse: 签名响应数据
+            
+        Raises:
+            RetryError: 签名器多次重试后仍然失败
         """
-        try:
+        async with _get_sign_semaphore():
             return await self.sign_server.sign(req_data)
-        except RetryError:
-            # 如果重试失败，尝试强制重新初始化
-            utils.logger.warning(
-                "[DouyinSignLogic.sign] Retry failed, attempting force reinit"
-            )
-            return await self.sign_server.sign(req_data, force_init=True)
+
+    def close(self) -> None:
+        """
+        释放签名器资源
+        """
+        self.sign_server.close()
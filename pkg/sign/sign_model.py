@@ -2,33 +2,41 @@
 """
 签名数据模型
 定义签名请求和响应的数据结构
+每次签名都会创建，且只在进程内部传递，使用dataclass避免pydantic校验开销
+无默认值的模型声明 __slots__，减少每个实例的内存占用
 """
 
+from dataclasses import dataclass
 from typing import Optional
 
-from pydantic import BaseModel, Field
 
-
-class DouyinSignResult(BaseModel):
+@dataclass
+class DouyinSignResult:
     """
     抖音签名结果
     包含生成的签名参数
     """
-    a_bogus: str = Field(..., title="a_bogus", description="抖音请求签名参数a_bogus")
+    __slots__ = ("a_bogus",)
+
+    a_bogus: str  # 抖音请求签名参数a_bogus
 
 
-class DouyinSignRequest(BaseModel):
+@dataclass
+class DouyinSignRequest:
     """
     抖音签名请求
     包含生成签名所需的所有参数
     """
-    uri: str = Field(..., title="request_uri", description="请求的URI")
-    query_params: str = Field(..., title="query_params", description="请求的query_params（URL编码后的参数）")
-    user_agent: str = Field(..., title="user_agent", description="请求的User-Agent")
-    cookies: str = Field(..., title="cookies", description="请求的Cookies")
+    __slots__ = ("uri", "query_params", "user_agent", "cookies")
+
+    uri: str  # 请求的URI
+    query_params: str  # 请求的query_params（URL编码后的参数）
+    user_agent: str  # 请求的User-Agent
+    cookies: str  # 请求的Cookies
 
 
-class DouyinSignResponse(BaseModel):
+@dataclass
+class DouyinSignResponse:
     """
     抖音签名响应
     包含签名结果和状态信息
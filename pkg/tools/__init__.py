@@ -2,10 +2,57 @@
 """
 工具函数模块
 包含爬虫相关的工具函数、时间处理函数等
+爬虫工具函数和时间函数在首次访问时才导入对应子模块（PEP 562）
 """
 
+import importlib
+
 from .utils import logger, init_logging_config
-from .crawler_util import *
-from .time_util import *
+
+# 延迟导出的函数名 -> 所在子模块
+_LAZY_ATTRS = {
+    'show_qrcode': '.crawler_util',
+    'get_user_agent': '.crawler_util',
+    'get_mobile_user_agent': '.crawler_util',
+    'convert_str_cookie_to_dict': '.crawler_util',
+    'match_interact_info_count': '.crawler_util',
+    'extract_text_from_html': '.crawler_util',
+    'extract_url_params_to_dict': '.crawler_util',
+    'get_current_timestamp': '.time_util',
+    'get_current_time': '.time_util',
+    'get_current_date': '.time_util',
+    'get_time_str_from_unix_time': '.time_util',
+    'get_time_str_from_unix_times': '.time_util',
+    'get_date_str_from_unix_time': '.time_util',
+    'get_unix_time_from_time_str': '.time_util',
+    'get_unix_timestamp': '.time_util',
+    'rfc2822_to_china_datetime': '.time_util',
+    'rfc2822_to_timestamp': '.time_util',
+}
 
 __all__ = ['logger', 'init_logging_config']
+
+
+def __getattr__(name: str):
+    """
+    按需导入工具函数，导入后缓存到模块命名空间
+    
+    Args:
+        name: 属性名
+        
+    Returns:
+        对应的工具函数
+        
+    Raises:
+        AttributeError: 属性不存在
+    """
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
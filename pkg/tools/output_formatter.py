@@ -5,6 +5,7 @@
 """
 
 import sys
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -27,7 +28,39 @@ class OutputFormatter:
     ACCOUNT = "[账号]"
     VIDEO = "[视频]"
     COMMENT = "[评论]"
+
+    # 进度输出的最小间隔（秒），间隔内的中间进度不再输出，最终进度总是输出
+    PROGRESS_MIN_INTERVAL = 0.1
+    _last_progress_time = 0.0
+
+    @staticmethod
+    def _write_lines(lines: List[str]):
+        """
+        一次性输出多行文本（只写一次标准输出，避免逐行print）
+        
+        Args:
+            lines: 文本行列表
+        """
+        sys.stdout.write("\n".join(lines) + "\n")
     
+    @staticmethod
+    def _header_lines(title: str, subtitle: str = "") -> List[str]:
+        """
+        生成标题头部的文本行
+        
+        Args:
+            title: 主标题
+            subtitle: 副标题（可选）
+            
+        Returns:
+            List[str]: 文本行列表
+        """
+        lines = ["\n" + "=" * 80, f"  {title}"]
+        if subtitle:
+            lines.append(f"  {subtitle}")
+        lines.append("=" * 80 + "\n")
+        return lines
+
     @staticmethod
     def print_header(title: str, subtitle: str = ""):
         """
@@ -37,11 +70,7 @@ class OutputFormatter:
             title: 主标题
             subtitle: 副标题（可选）
         """
-        print("\n" + "=" * 80)
-        print(f"  {title}")
-        if subtitle:
-            print(f"  {subtitle}")
-        print("=" * 80 + "\n")
+        OutputFormatter._write_lines(OutputFormatter._header_lines(title, subtitle))
     
     @staticmethod
     def print_section(title: str):
@@ -51,9 +80,11 @@ class OutputFormatter:
         Args:
             title: 章节标题
         """
-        print(f"\n{'─' * 60}")
-        print(f"  {title}")
-        print(f"{'─' * 60}\n")
+        lines: List[str] = []
+        lines.append(f"\n{'─' * 60}")
+        lines.append(f"  {title}")
+        lines.append(f"{'─' * 60}\n")
+        OutputFormatter._write_lines(lines)
     
     @staticmethod
     def print_info(message: str, icon: str = "[信息]"):
@@ -106,6 +137,7 @@ class OutputFormatter:
     ):
         """
         打印进度信息
+        距上次输出不足 PROGRESS_MIN_INTERVAL 秒的中间进度会被跳过，完成时的进度总是输出
         
         Args:
             current: 当前数量
@@ -114,6 +146,11 @@ class OutputFormatter:
             prefix: 前缀文本
             show_percentage: 是否显示百分比
         """
+        now = time.monotonic()
+        if current < total and now - OutputFormatter._last_progress_time < OutputFormatter.PROGRESS_MIN_INTERVAL:
+            return
+        OutputFormatter._last_progress_time = now
+
         if total == 0:
             percentage = 0
         else:
@@ -132,10 +169,24 @@ class OutputFormatter:
         Args:
             checkpoint_data: 断点数据字典
         """
-        print(f"\n{OutputFormatter.CHECKPOINT} 断点信息:")
-        print(f"  • 断点ID: {checkpoint_data.get('id', '未知')}")
-        print(f"  • 平台: {checkpoint_data.get('platform', '未知')}")
-        print(f"  • 模式: {checkpoint_data.get('mode', '未知')}")
+        OutputFormatter._write_lines(OutputFormatter._checkpoint_info_lines(checkpoint_data))
+
+    @staticmethod
+    def _checkpoint_info_lines(checkpoint_data: Dict) -> List[str]:
+        """
+        生成断点信息的文本行
+        
+        Args:
+            checkpoint_data: 断点数据字典
+            
+        Returns:
+            List[str]: 文本行列表
+        """
+        lines: List[str] = []
+        lines.append(f"\n{OutputFormatter.CHECKPOINT} 断点信息:")
+        lines.append(f"  • 断点ID: {checkpoint_data.get('id', '未知')}")
+        lines.append(f"  • 平台: {checkpoint_data.get('platform', '未知')}")
+        lines.append(f"  • 模式: {checkpoint_data.get('mode', '未知')}")
         
         # 根据模式显示不同的断点信息
         mode = checkpoint_data.get('mode', '')
@@ -145,29 +196,30 @@ class OutputFormatter:
             if creator_id:
                 # 限制显示长度
                 display_id = creator_id[:30] + "..." if len(creator_id) > 30 else creator_id
-                print(f"  • 当前创作者: {display_id}")
+                lines.append(f"  • 当前创作者: {display_id}")
             if page and page != '0':
-                print(f"  • 当前页码: {page}")
+                lines.append(f"  • 当前页码: {page}")
         elif mode == 'search':
             keyword = checkpoint_data.get('current_search_keyword', '')
             page = checkpoint_data.get('current_search_page', 1)
             search_id = checkpoint_data.get('current_search_id', '')
             if keyword:
-                print(f"  • 当前关键词: {keyword}")
+                lines.append(f"  • 当前关键词: {keyword}")
             if page and page > 1:
-                print(f"  • 当前页码: {page}")
+                lines.append(f"  • 当前页码: {page}")
             if search_id:
-                print(f"  • 搜索ID: {search_id[:20]}...")
+                lines.append(f"  • 搜索ID: {search_id[:20]}...")
         elif mode == 'homefeed':
             refresh_index = checkpoint_data.get('current_homefeed_note_index', 0)
             if refresh_index:
-                print(f"  • 当前刷新索引: {refresh_index}")
+                lines.append(f"  • 当前刷新索引: {refresh_index}")
         
         # 显示已爬取数量
         notes = checkpoint_data.get('crawled_note_list', [])
         if notes:
             crawled_count = len([n for n in notes if n.get('is_success_crawled', False)])
-            print(f"  • 已爬取数量: {crawled_count}")
+            lines.append(f"  • 已爬取数量: {crawled_count}")
+        return lines
     
     @staticmethod
     def print_resume_info(checkpoint_data: Dict):
@@ -177,32 +229,34 @@ class OutputFormatter:
         Args:
             checkpoint_data: 断点数据字典
         """
-        print(f"\n{OutputFormatter.CHECKPOINT} 从断点继续爬取:")
+        lines: List[str] = []
+        lines.append(f"\n{OutputFormatter.CHECKPOINT} 从断点继续爬取:")
         mode = checkpoint_data.get('mode', '')
         
         if mode == 'creator':
             creator_id = checkpoint_data.get('current_creator_id', '')
             page = checkpoint_data.get('current_creator_page', '0')
             if creator_id:
-                print(f"  • 继续从创作者: {creator_id}")
+                lines.append(f"  • 继续从创作者: {creator_id}")
             if page and page != '0':
-                print(f"  • 继续从页码: {page}")
+                lines.append(f"  • 继续从页码: {page}")
         elif mode == 'search':
             keyword = checkpoint_data.get('current_search_keyword', '')
             page = checkpoint_data.get('current_search_page', 1)
             if keyword:
-                print(f"  • 继续从关键词: {keyword}")
+                lines.append(f"  • 继续从关键词: {keyword}")
             if page and page > 1:
-                print(f"  • 继续从页码: {page}")
+                lines.append(f"  • 继续从页码: {page}")
         elif mode == 'homefeed':
             refresh_index = checkpoint_data.get('current_homefeed_note_index', 0)
             if refresh_index:
-                print(f"  • 继续从刷新索引: {refresh_index}")
+                lines.append(f"  • 继续从刷新索引: {refresh_index}")
         
         notes = checkpoint_data.get('crawled_note_list', [])
         if notes:
             crawled_count = len([n for n in notes if n.get('is_success_crawled', False)])
-            print(f"  • 已爬取: {crawled_count} 项")
+            lines.append(f"  • 已爬取: {crawled_count} 项")
+        OutputFormatter._write_lines(lines)
     
     @staticmethod
     def print_interrupt_info(
@@ -218,23 +272,25 @@ class OutputFormatter:
             checkpoint_data: 断点数据（可选）
             stats: 统计信息（可选）
         """
-        print("\n" + "=" * 80)
-        print(f"{OutputFormatter.WARNING} 爬虫中断")
-        print("=" * 80)
-        print(f"\n中断原因: {reason}")
+        lines: List[str] = []
+        lines.append("\n" + "=" * 80)
+        lines.append(f"{OutputFormatter.WARNING} 爬虫中断")
+        lines.append("=" * 80)
+        lines.append(f"\n中断原因: {reason}")
         
         if checkpoint_data:
-            print("\n当前断点状态:")
-            OutputFormatter.print_checkpoint_info(checkpoint_data)
+            lines.append("\n当前断点状态:")
+            lines.extend(OutputFormatter._checkpoint_info_lines(checkpoint_data))
         
         if stats:
-            print("\n爬取统计:")
+            lines.append("\n爬取统计:")
             for key, value in stats.items():
-                print(f"  • {key}: {value}")
+                lines.append(f"  • {key}: {value}")
         
-        print("\n" + "=" * 80)
-        print("[提示] 下次运行时会从断点继续爬取（如果启用了断点续爬功能）")
-        print("=" * 80 + "\n")
+        lines.append("\n" + "=" * 80)
+        lines.append("[提示] 下次运行时会从断点继续爬取（如果启用了断点续爬功能）")
+        lines.append("=" * 80 + "\n")
+        OutputFormatter._write_lines(lines)
     
     @staticmethod
     def print_crawler_start(
@@ -248,11 +304,12 @@ class OutputFormatter:
             crawler_type: 爬取类型
             config_info: 配置信息字典
         """
-        OutputFormatter.print_header("DouyinCrawler 启动", f"爬取类型: {crawler_type}")
+        lines = OutputFormatter._header_lines("DouyinCrawler 启动", f"爬取类型: {crawler_type}")
         
-        print(f"{OutputFormatter.INFO} 配置信息:")
+        lines.append(f"{OutputFormatter.INFO} 配置信息:")
         for key, value in config_info.items():
-            print(f"  • {key}: {value}")
+            lines.append(f"  • {key}: {value}")
+        OutputFormatter._write_lines(lines)
     
     @staticmethod
     def print_crawler_summary(stats: Dict):
@@ -262,12 +319,13 @@ class OutputFormatter:
         Args:
             stats: 统计信息字典
         """
-        OutputFormatter.print_header("爬取完成", "统计信息")
+        lines = OutputFormatter._header_lines("爬取完成", "统计信息")
         
         for key, value in stats.items():
-            print(f"  • {key}: {value}")
+            lines.append(f"  • {key}: {value}")
         
-        print("\n" + "=" * 80 + "\n")
+        lines.append("\n" + "=" * 80 + "\n")
+        OutputFormatter._write_lines(lines)
     
     @staticmethod
     def print_account_info(account_name: str, status: str = "正常"):
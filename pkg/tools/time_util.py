@@ -5,7 +5,9 @@
 """
 
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, List
 
 
 def get_current_timestamp() -> int:
@@ -15,7 +17,7 @@ def get_current_timestamp() -> int:
     Returns:
         int: 当前时间戳，例如：1701493264496
     """
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def get_current_time(time_format: str = "%Y-%m-%d %X") -> str:
@@ -31,14 +33,23 @@ def get_current_time(time_format: str = "%Y-%m-%d %X") -> str:
     return time.strftime(time_format, time.localtime())
 
 
+# get_current_date 的缓存：(整数秒, 日期字符串)，同一秒内直接复用，并发写入时值相同无需加锁
+_current_date_cache = (-1, "")
+
+
 def get_current_date() -> str:
     """
     获取当前的日期字符串
+    同一秒内的重复调用复用上次格式化的结果
     
     Returns:
         str: 日期字符串，例如：'2023-12-02'
     """
-    return time.strftime('%Y-%m-%d', time.localtime())
+    global _current_date_cache
+    sec = int(time.time())
+    if sec != _current_date_cache[0]:
+        _current_date_cache = (sec, time.strftime('%Y-%m-%d', time.localtime(sec)))
+    return _current_date_cache[1]
 
 
 def get_time_str_from_unix_time(unixtime):
@@ -51,12 +62,35 @@ def get_time_str_from_unix_time(unixtime):
     Returns:
         str: 日期时间字符串，例如：'2023-12-02 13:01:23'
     """
-    # 如果是毫秒级时间戳，转换为秒级
-    if int(unixtime) > 1000000000000:
-        unixtime = int(unixtime) / 1000
+    # 如果是毫秒级时间戳，转换为秒级（只解析一次）
+    unixtime = int(unixtime)
+    if unixtime > 1000000000000:
+        unixtime //= 1000
     return time.strftime('%Y-%m-%d %X', time.localtime(unixtime))
 
 
+def get_time_str_from_unix_times(unixtimes: Iterable) -> List[str]:
+    """
+    批量将Unix时间戳转换为字符串日期时间
+    用于整列时间戳的格式化，避免逐个调用 get_time_str_from_unix_time 的函数调用开销
+    
+    Args:
+        unixtimes: Unix时间戳序列（秒级或毫秒级）
+        
+    Returns:
+        List[str]: 日期时间字符串列表，例如：['2023-12-02 13:01:23']
+    """
+    strftime, localtime = time.strftime, time.localtime
+    time_strs = []
+    for unixtime in unixtimes:
+        unixtime = int(unixtime)
+        # 如果是毫秒级时间戳，转换为秒级
+        if unixtime > 1000000000000:
+            unixtime //= 1000
+        time_strs.append(strftime('%Y-%m-%d %X', localtime(unixtime)))
+    return time_strs
+
+
 def get_date_str_from_unix_time(unixtime):
     """
     将Unix时间戳转换为字符串日期
@@ -67,9 +101,10 @@ def get_date_str_from_unix_time(unixtime):
     Returns:
         str: 日期字符串，例如：'2023-12-02'
     """
-    # 如果是毫秒级时间戳，转换为秒级
-    if int(unixtime) > 1000000000000:
-        unixtime = int(unixtime) / 1000
+    # 如果是毫秒级时间戳，转换为秒级（只解析一次）
+    unixtime = int(unixtime)
+    if unixtime > 1000000000000:
+        unixtime //= 1000
     return time.strftime('%Y-%m-%d', time.localtime(unixtime))
 
 
@@ -111,11 +146,8 @@ def rfc2822_to_china_datetime(rfc2822_time):
     Returns:
         datetime: 中国时区的datetime对象
     """
-    # 定义RFC 2822格式
-    rfc2822_format = "%a %b %d %H:%M:%S %z %Y"
-    
-    # 将RFC 2822时间字符串转换为datetime对象
-    dt_object = datetime.strptime(rfc2822_time, rfc2822_format)
+    # 将RFC 2822时间字符串转换为带时区的datetime对象
+    dt_object = parsedate_to_datetime(rfc2822_time)
     
     # 将datetime对象的时区转换为中国时区（UTC+8）
     dt_object_china = dt_object.astimezone(timezone(timedelta(hours=8)))
@@ -132,16 +164,5 @@ def rfc2822_to_timestamp(rfc2822_time):
     Returns:
         int: Unix时间戳（秒级）
     """
-    # 定义RFC 2822格式
-    rfc2822_format = "%a %b %d %H:%M:%S %z %Y"
-    
-    # 将RFC 2822时间字符串转换为datetime对象
-    dt_object = datetime.strptime(rfc2822_time, rfc2822_format)
-    
-    # 将datetime对象转换为UTC时间
-    dt_utc = dt_object.replace(tzinfo=timezone.utc)
-    
-    # 计算UTC时间对应的Unix时间戳
-    timestamp = int(dt_utc.timestamp())
-    
-    return timestamp
+    # 解析结果已带时区信息，直接计算Unix时间戳
+    return int(parsedate_to_datetime(rfc2822_time).timestamp())
@@ -8,16 +8,18 @@ import argparse
 import os
 import random
 import sys
-from random import Random
 
 from loguru import logger as _loguru_logger
 
-from .crawler_util import *
 from .time_util import *
 
 
 # 延迟初始化标志，避免与config模块的循环导入
 _logger_initialized = False
+# 日志位置字符串缓存的最大条目数
+LOCATION_CACHE_MAX_SIZE = 4096
+# 项目根目录（pkg/tools/utils.py -> pkg/tools -> pkg -> 项目根目录）
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def get_logger():
@@ -37,20 +39,18 @@ def get_logger():
     # 移除默认处理器
     _loguru_logger.remove()
 
-    # 缓存文件路径处理结果，避免重复计算
-    _file_name_cache = {}
-    
-    def get_file_name(file_path):
-        """获取文件名，使用缓存优化性能"""
-        if file_path not in _file_name_cache:
-            _file_name_cache[file_path] = os.path.basename(file_path)
-        return _file_name_cache[file_path]
+    # 缓存格式化后的位置字符串：(文件, 函数, 行号) -> "文件名:函数:行号"
+    _location_cache = {}
     
     # 自定义过滤器，添加位置字段（文件:函数:行号）
     def add_location(record):
-        # 简化文件路径，只显示文件名（使用缓存优化）
-        file_name = get_file_name(record['file'].name)
-        location = f"{file_name}:{record['function']}:{record['line']}"
+        key = (record['file'].name, record['function'], record['line'])
+        location = _location_cache.get(key)
+        if location is None:
+            # 简化文件路径，只显示文件名；超过上限时淘汰最早加入的条目
+            if len(_location_cache) >= LOCATION_CACHE_MAX_SIZE:
+                del _location_cache[next(iter(_location_cache))]
+            location = _location_cache[key] = f"{os.path.basename(key[0])}:{key[1]}:{key[2]}"
         record["extra"]["location"] = location
         return True
 
@@ -71,19 +71,14 @@ def get_logger():
     # 如果启用了日志文件，添加文件处理器
     if config.ENABLE_LOG_FILE:
         # 创建logs目录
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        log_dir = os.path.join(project_root, 'logs', 'douyin')  # 抖音爬虫使用固定的'douyin'目录
+        log_dir = os.path.join(_PROJECT_ROOT, 'logs', 'douyin')  # 抖音爬虫使用固定的'douyin'目录
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
 
         log_file = os.path.join(log_dir, f"{get_current_date()}.log")
 
-        # 文件日志的自定义过滤器
-        def add_location_file(record):
-            location = f"{record['file'].name}:{record['function']}:{record['line']}"
-            record["extra"]["location"] = location
-            return True
-
+        # enqueue=True：文件写入交给loguru的后台线程，不阻塞事件循环；
+        # 后台线程在进程退出时由loguru关闭，之后（如atexit回调中）记录的日志可能丢失
         _loguru_logger.add(
             log_file,
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {extra[location]: <60} - {message}",
@@ -91,7 +86,8 @@ def get_logger():
             encoding="utf-8",
             rotation="00:00",  # 每天午夜轮转
             retention="30 days",  # 保留30天的日志
-            filter=add_location_file
+            enqueue=True,
+            filter=add_location
         )
 
     _logger_initialized = True
@@ -102,15 +98,33 @@ def get_logger():
 class LoggerProxy:
     """
     日志代理对象，在首次访问时初始化日志记录器
+    访问过的属性缓存到实例上，之后的 logger.info 等调用不再经过 __getattr__
     """
     def __getattr__(self, name):
-        return getattr(get_logger(), name)
+        value = getattr(get_logger(), name)
+        object.__setattr__(self, name, value)
+        return value
 
 
 # 全局日志记录器实例
 logger = LoggerProxy()
 
 
+def is_log_level_enabled(level: str) -> bool:
+    """
+    判断指定日志级别是否会被任一处理器接收
+    用于在热路径上跳过昂贵的日志内容构建
+    
+    Args:
+        level: 日志级别名称，例如 "INFO"、"ERROR"
+        
+    Returns:
+        bool: True表示该级别的日志会被输出
+    """
+    _logger = get_logger()
+    return _logger._core.min_level <= _logger.level(level.upper()).no
+
+
 def init_logging_config():
     """
     初始化日志配置（用于向后兼容）
@@ -121,6 +135,11 @@ def init_logging_config():
     return get_logger()
 
 
+# str2bool 可识别的真/假字符串（小写）
+_TRUE_STRINGS = frozenset(('yes', 'true', 't', 'y', '1'))
+_FALSE_STRINGS = frozenset(('no', 'false', 'f', 'n', '0'))
+
+
 def str2bool(v):
     """
     将字符串转换为布尔值
@@ -136,14 +155,19 @@ def str2bool(v):
     """
     if isinstance(v, bool):
         return v
-    if v.lower() in ('yes', 'true', 't', 'y', '1'):
+    v = v.lower()
+    if v in _TRUE_STRINGS:
         return True
-    elif v.lower() in ('no', 'false', 'f', 'n', '0'):
+    elif v in _FALSE_STRINGS:
         return False
     else:
         raise argparse.ArgumentTypeError('Boolean value expected.')
 
 
+# get_random_str 使用的字符集
+_RANDOM_STR_CHARS = 'AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz0123456789'
+
+
 def get_random_str(random_len: int = 12) -> str:
     """
     获取随机字符串
@@ -154,13 +178,11 @@ def get_random_str(random_len: int = 12) -> str:
     Returns:
         str: 随机字符串
     """
-    random_str = ''
-    chars = 'AaBbCcDdEeFfGgHhIiJjKkLlMmNnOoPpQqRrSsTtUuVvWwXxYyZz0123456789'
-    length = len(chars) - 1
-    _random = Random()
-    for _ in range(random_len):
-        random_str += chars[_random.randint(0, length)]
-    return random_str
+    return ''.join(random.choices(_RANDOM_STR_CHARS, k=random_len))
+
+
+# 预先绑定 random.randint，省去每次调用的模块属性查找
+_randint = random.randint
 
 
 def random_delay_time(min_time: int = 1, max_time: int = 3) -> int:
@@ -174,7 +196,42 @@ def random_delay_time(min_time: int = 1, max_time: int = 3) -> int:
     Returns:
         int: 随机延迟时间（秒）
     """
-    return random.randint(min_time, max_time)
+    return _randint(min_time, max_time)
+
+
+# 错误解决建议：(错误信息中的关键词, 建议内容)，按顺序匹配，命中第一个即停止
+_ERROR_SUGGESTIONS = (
+    (("account", "unauthorized"), (
+        "[提示] 解决建议:",
+        "   1. 检查账号Cookie是否过期，需要重新提取",
+        "   2. 检查账号是否被封禁，尝试更换账号",
+        "   3. 检查config/accounts_cookies.xlsx中的账号配置是否正确",
+    )),
+    (("rate limited", "429"), (
+        "[提示] 解决建议:",
+        "   1. 请求过于频繁，等待一段时间后重试",
+        "   2. 增加CRAWLER_TIME_SLEEP配置，降低请求频率",
+        "   3. 使用更多账号进行轮换",
+    )),
+    (("connection", "network"), (
+        "[提示] 解决建议:",
+        "   1. 检查网络连接是否正常",
+        "   2. 检查代理IP是否可用",
+        "   3. 检查签名服务是否正常运行（端口8989）",
+    )),
+    (("proxy",), (
+        "[提示] 解决建议:",
+        "   1. 检查代理IP配置是否正确",
+        "   2. 检查代理IP是否可用",
+        "   3. 尝试更换代理IP",
+    )),
+    (("checkpoint",), (
+        "[提示] 解决建议:",
+        "   1. 检查断点文件是否存在且格式正确",
+        "   2. 检查data/checkpoints目录是否有写入权限",
+        "   3. 如果断点文件损坏，可以删除后重新开始",
+    )),
+)
 
 
 def format_error_message(exception: Exception, context: dict = None) -> str:
@@ -209,77 +266,36 @@ def format_error_message(exception: Exception, context: dict = None) -> str:
                 value_str = value_str[:200] + "..."
             lines.append(f"   • {key}: {value_str}")
     
-    # 根据错误类型提供解决建议（使用小写比较，避免重复转换）
+    # 根据错误类型提供解决建议（使用小写比较，按顺序取第一个匹配的建议）
     error_msg_lower = error_message.lower()
-    suggestions = []
-    
-    if "account" in error_msg_lower or "unauthorized" in error_msg_lower:
-        suggestions.extend([
-            "[提示] 解决建议:",
-            "   1. 检查账号Cookie是否过期，需要重新提取",
-            "   2. 检查账号是否被封禁，尝试更换账号",
-            "   3. 检查config/accounts_cookies.xlsx中的账号配置是否正确",
-        ])
-    elif "rate limited" in error_msg_lower or "429" in error_message:
-        suggestions.extend([
-            "[提示] 解决建议:",
-            "   1. 请求过于频繁，等待一段时间后重试",
-            "   2. 增加CRAWLER_TIME_SLEEP配置，降低请求频率",
-            "   3. 使用更多账号进行轮换",
-        ])
-    elif "connection" in error_msg_lower or "network" in error_msg_lower:
-        suggestions.extend([
-            "[提示] 解决建议:",
-            "   1. 检查网络连接是否正常",
-            "   2. 检查代理IP是否可用",
-            "   3. 检查签名服务是否正常运行（端口8989）",
-        ])
-    elif "proxy" in error_msg_lower:
-        suggestions.extend([
-            "[提示] 解决建议:",
-            "   1. 检查代理IP配置是否正确",
-            "   2. 检查代理IP是否可用",
-            "   3. 尝试更换代理IP",
-        ])
-    elif "checkpoint" in error_msg_lower:
-        suggestions.extend([
-            "[提示] 解决建议:",
-            "   1. 检查断点文件是否存在且格式正确",
-            "   2. 检查data/checkpoints目录是否有写入权限",
-            "   3. 如果断点文件损坏，可以删除后重新开始",
-        ])
-    
-    if suggestions:
-        lines.append("")
-        lines.extend(suggestions)
+    for keywords, suggestions in _ERROR_SUGGESTIONS:
+        if any(keyword in error_msg_lower for keyword in keywords):
+            lines.append("")
+            lines += suggestions
+            break
     
     # 一次性join，性能更好
     return "\n".join(lines)
 
 
-def log_error_with_context(logger, exception: Exception, context: dict = None, level: str = "ERROR"):
+def log_error_with_context(logger, exception: Exception, context=None, level: str = "ERROR"):
     """
     记录带上下文的错误信息
+    如果该日志级别未启用，不会构建上下文和错误消息
     
     Args:
         logger: 日志记录器
         exception: 异常对象
-        context: 上下文信息字典
+        context: 上下文信息字典，或返回字典的可调用对象（仅在需要输出时调用）
         level: 日志级别，默认为ERROR
     """
-    error_msg = format_error_message(exception, context)
-    
-    # 根据级别记录日志（使用 opt(exception=True) 获取完整堆栈，但不影响正常日志性能）
-    if level.upper() == "ERROR":
-        logger.error(error_msg)
-        # 只在错误时记录完整堆栈
-        logger.opt(exception=True).error("完整异常堆栈:")
-    elif level.upper() == "WARNING":
-        logger.warning(error_msg)
-        logger.opt(exception=True).warning("完整异常堆栈:")
-    elif level.upper() == "CRITICAL":
-        logger.critical(error_msg)
-        logger.opt(exception=True).critical("完整异常堆栈:")
-    else:
-        logger.error(error_msg)
-        logger.opt(exception=True).error("完整异常堆栈:")
+    level = level.upper()
+    if level not in ("ERROR", "WARNING", "CRITICAL"):
+        level = "ERROR"
+
+    def build_error_msg() -> str:
+        return format_error_message(exception, context() if callable(context) else context)
+
+    # 错误信息和完整异常堆栈合并为一条日志记录输出
+    # lazy=True：只有日志会被输出时才构建上下文和错误消息
+    logger.opt(lazy=True, exception=True).log(level, "{}", build_error_msg)
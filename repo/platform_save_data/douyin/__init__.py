@@ -4,7 +4,8 @@
 提供抖音视频、评论、创作者数据的存储功能
 """
 
-from typing import List
+import asyncio
+from typing import Dict, List
 
 import config
 from base.base_crawler import AbstractStore
@@ -18,6 +19,26 @@ from .douyin_store_impl import (
 )
 
 
+# 每条数据都会记录日志，复用同一个 lazy 日志对象，避免每次调用 opt() 重新创建
+# 首次使用时才创建，保证日志在命令行参数解析、日志初始化之后才被配置
+_lazy_logger = None
+
+
+def _log_info_lazy(message: str, *args) -> None:
+    """
+    以 lazy 方式记录INFO日志，参数为可调用对象，只有日志会被输出时才求值
+    
+    Args:
+        message: 日志格式字符串（使用 {} 占位）
+        args: 返回占位参数值的可调用对象
+    """
+    global _lazy_logger
+    if _lazy_logger is None:
+        # depth=1：日志位置显示为调用方（update_* 函数）
+        _lazy_logger = utils.logger.opt(lazy=True, depth=1)
+    _lazy_logger.info(message, *args)
+
+
 class DouyinStoreFactory:
     """
     抖音存储工厂类
@@ -28,6 +49,9 @@ class DouyinStoreFactory:
         "json": DouyinJsonStoreImplement,
     }
 
+    # 已创建的存储实例：存储类型 -> 实例，每条数据复用同一个实例
+    _store_instances: Dict[str, AbstractStore] = {}
+
     @staticmethod
     def create_store() -> AbstractStore:
         """
@@ -46,6 +70,31 @@ class DouyinStoreFactory:
             )
         return store_class()
 
+    @staticmethod
+    def get_store() -> AbstractStore:
+        """
+        获取当前存储类型对应的存储实例，首次调用时创建
+        
+        Returns:
+            AbstractStore: 存储实例
+            
+        Raises:
+            ValueError: 如果存储类型无效
+        """
+        store = DouyinStoreFactory._store_instances.get(config.SAVE_DATA_OPTION)
+        if store is None:
+            store = DouyinStoreFactory.create_store()
+            DouyinStoreFactory._store_instances[config.SAVE_DATA_OPTION] = store
+        return store
+
+
+async def close_store():
+    """
+    关闭存储层占用的资源（CSV文件句柄等）
+    在爬虫结束时调用，保证缓冲的数据全部写入文件
+    """
+    await DouyinCsvStoreImplement.close()
+
 
 async def batch_update_douyin_awemes(awemes: List[DouyinAweme]):
     """
@@ -57,8 +106,8 @@ async def batch_update_douyin_awemes(awemes: List[DouyinAweme]):
     if not awemes:
         return
 
-    for aweme_item in awemes:
-        await update_douyin_aweme(aweme_item)
+    # 并发保存，各存储实现内部用锁保证同一文件的写入不会交错
+    await asyncio.gather(*(update_douyin_aweme(aweme_item) for aweme_item in awemes))
 
 
 async def update_douyin_aweme(aweme_item: DouyinAweme):
@@ -74,16 +123,17 @@ async def update_douyin_aweme(aweme_item: DouyinAweme):
     
     # 转换为字典并添加时间戳
     local_db_item = aweme_item.model_dump()
-    local_db_item.update({"last_modify_ts": utils.get_current_timestamp()})
+    local_db_item["last_modify_ts"] = utils.get_current_timestamp()
 
-    # 打印日志
-    print_title = aweme_item.title[:30] if aweme_item.title else aweme_item.desc[:30]
-    utils.logger.info(
-        f"[store.douyin.update_douyin_aweme] douyin aweme, id: {aweme_item.aweme_id}, title: {print_title}"
+    # 打印日志（lazy：只有日志会被输出时才截取标题）
+    _log_info_lazy(
+        "[store.douyin.update_douyin_aweme] douyin aweme, id: {}, title: {}",
+        lambda: aweme_item.aweme_id,
+        lambda: (aweme_item.title or aweme_item.desc)[:30],
     )
     
     # 保存到存储层
-    await DouyinStoreFactory.create_store().store_content(local_db_item)
+    await DouyinStoreFactory.get_store().store_content(local_db_item)
 
 
 async def batch_update_dy_aweme_comments(aweme_id: str, comments: List[DouyinAwemeComment]):
@@ -97,8 +147,8 @@ async def batch_update_dy_aweme_comments(aweme_id: str, comments: List[DouyinAwe
     if not comments:
         return
 
-    for comment_item in comments:
-        await update_dy_aweme_comment(comment_item)
+    # 并发保存，各存储实现内部用锁保证同一文件的写入不会交错
+    await asyncio.gather(*(update_dy_aweme_comment(comment_item) for comment_item in comments))
 
 
 async def update_dy_aweme_comment(comment_item: DouyinAwemeComment):
@@ -111,15 +161,16 @@ async def update_dy_aweme_comment(comment_item: DouyinAwemeComment):
     """
     # 转换为字典并添加时间戳
     local_db_item = comment_item.model_dump()
-    local_db_item.update({"last_modify_ts": utils.get_current_timestamp()})
+    local_db_item["last_modify_ts"] = utils.get_current_timestamp()
 
-    utils.logger.info(
-        f"[store.douyin.update_dy_aweme_comment] douyin aweme comment, "
-        f"aweme_id: {comment_item.aweme_id}, comment_id: {comment_item.comment_id}"
+    _log_info_lazy(
+        "[store.douyin.update_dy_aweme_comment] douyin aweme comment, aweme_id: {}, comment_id: {}",
+        lambda: comment_item.aweme_id,
+        lambda: comment_item.comment_id,
     )
     
     # 保存到存储层
-    await DouyinStoreFactory.create_store().store_comment(local_db_item)
+    await DouyinStoreFactory.get_store().store_comment(local_db_item)
 
 
 async def save_creator(user_id: str, creator: DouyinCreator):
@@ -135,11 +186,13 @@ async def save_creator(user_id: str, creator: DouyinCreator):
 
     # 转换为字典并添加时间戳
     local_db_item = creator.model_dump()
-    local_db_item.update({"last_modify_ts": utils.get_current_timestamp()})
+    local_db_item["last_modify_ts"] = utils.get_current_timestamp()
 
-    utils.logger.info(
-        f"[store.douyin.save_creator] douyin creator, id: {creator.user_id}, nickname: {creator.nickname}"
+    _log_info_lazy(
+        "[store.douyin.save_creator] douyin creator, id: {}, nickname: {}",
+        lambda: creator.user_id,
+        lambda: creator.nickname,
     )
     
     # 保存到存储层
-    await DouyinStoreFactory.create_store().store_creator(local_db_item)
+    await DouyinStoreFactory.get_store().store_creator(local_db_item)
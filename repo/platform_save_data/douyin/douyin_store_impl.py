@@ -6,12 +6,13 @@
 
 import asyncio
 import csv
-import json
+import io
 import os
 import pathlib
-from typing import Dict
+from typing import Any, Dict, Optional, Set
 
 import aiofiles
+import orjson
 
 import config
 from base.base_crawler import AbstractStore
@@ -19,6 +20,24 @@ from pkg.tools import utils
 from var import crawler_type_var
 
 
+# 追加JSON数据时读取的文件末尾字节数，用于定位数组的结束括号
+JSON_TAIL_READ_SIZE = 64
+
+# 本进程中已确认存在的存储目录
+_ensured_store_dirs: Set[str] = set()
+
+
+def ensure_store_dir(store_path: str) -> None:
+    """
+    确保存储目录存在，每个目录在进程内只创建/检查一次
+    
+    Args:
+        store_path: 存储目录路径
+    """
+    if store_path not in _ensured_store_dirs:
+        pathlib.Path(store_path).mkdir(parents=True, exist_ok=True)
+        _ensured_store_dirs.add(store_path)
+
 
 def calculate_number_of_files(file_store_path: str) -> int:
     """
@@ -33,19 +52,16 @@ def calculate_number_of_files(file_store_path: str) -> int:
     """
     if not os.path.exists(file_store_path):
         return 1
+    max_number = 0
     try:
-        return (
-            max(
-                [
-                    int(file_name.split("_")[0])
-                    for file_name in os.listdir(file_store_path)
-                    if file_name.split("_")[0].isdigit()
-                ]
-            )
-            + 1
-        )
-    except (ValueError, IndexError):
+        with os.scandir(file_store_path) as entries:
+            for entry in entries:
+                prefix = entry.name.partition("_")[0]
+                if prefix.isdigit():
+                    max_number = max(max_number, int(prefix))
+    except (ValueError, OSError):
         return 1
+    return max_number + 1
 
 
 class DouyinCsvStoreImplement(AbstractStore):
@@ -55,6 +71,10 @@ class DouyinCsvStoreImplement(AbstractStore):
     """
     csv_store_path: str = "data/douyin"
     file_count: int = calculate_number_of_files(csv_store_path)
+    # 已打开的CSV文件句柄：文件名 -> 句柄，由 close() 统一关闭
+    _handles: Dict[str, Any] = {}
+    # 锁在首次写入时于运行中的事件循环内创建，避免导入时绑定到其他事件循环
+    _lock: Optional[asyncio.Lock] = None
 
     def make_save_file_name(self, store_type: str) -> str:
         """
@@ -71,25 +91,45 @@ class DouyinCsvStoreImplement(AbstractStore):
     async def save_data_to_csv(self, save_item: Dict, store_type: str):
         """
         将数据保存到CSV文件
+        每个文件只打开一次，后续数据复用同一个文件句柄写入，每行写入后刷新
         
         Args:
             save_item: 要保存的数据字典
             store_type: 存储类型（contents/comments/creator）
         """
-        # 创建目录
-        pathlib.Path(self.csv_store_path).mkdir(parents=True, exist_ok=True)
         save_file_name = self.make_save_file_name(store_type=store_type)
-        
-        # 异步写入CSV文件
-        async with aiofiles.open(
-            save_file_name, mode="a+", encoding="utf-8-sig", newline=""
-        ) as f:
-            writer = csv.writer(f)
-            # 如果是新文件，先写入表头
-            if await f.tell() == 0:
-                await writer.writerow(save_item.keys())
-            # 写入数据行
-            await writer.writerow(save_item.values())
+
+        if DouyinCsvStoreImplement._lock is None:
+            DouyinCsvStoreImplement._lock = asyncio.Lock()
+        async with DouyinCsvStoreImplement._lock:
+            is_new_file = False
+            f = DouyinCsvStoreImplement._handles.get(save_file_name)
+            if f is None:
+                # 创建目录
+                ensure_store_dir(self.csv_store_path)
+                # 打开前判断是否为新文件，新文件需要先写入表头
+                is_new_file = not os.path.exists(save_file_name) or os.path.getsize(save_file_name) == 0
+                f = await aiofiles.open(save_file_name, mode="a", encoding="utf-8-sig", newline="")
+                DouyinCsvStoreImplement._handles[save_file_name] = f
+            # 先在内存中同步生成CSV文本，再一次性异步写入，避免每行都经过线程池
+            buf = io.StringIO()
+            writer = csv.writer(buf)
+            if is_new_file:
+                writer.writerow(save_item.keys())
+            writer.writerow(save_item.values())
+            await f.write(buf.getvalue())
+            # 每行写入后立即刷新到文件，进程异常退出（未执行清理）时不会丢失已保存的数据
+            await f.flush()
+
+    @classmethod
+    async def close(cls):
+        """
+        刷新并关闭所有已打开的CSV文件
+        """
+        handles = list(cls._handles.values())
+        cls._handles.clear()
+        for f in handles:
+            await f.close()
 
     async def store_content(self, content_item: Dict):
         """
@@ -125,7 +165,9 @@ class DouyinJsonStoreImplement(AbstractStore):
     将数据保存为JSON文件格式
     """
     json_store_path: str = "data/douyin/json"
-    lock = asyncio.Lock()
+    # 每个文件一把锁：不同文件的写入互不阻塞
+    # 锁在首次写入时于运行中的事件循环内创建，避免导入时绑定到其他事件循环
+    _locks: Dict[str, asyncio.Lock] = {}
     file_count: int = calculate_number_of_files(json_store_path)
 
     def make_save_file_name(self, store_type: str) -> str:
@@ -143,31 +185,61 @@ class DouyinJsonStoreImplement(AbstractStore):
     async def save_data_to_json(self, save_item: Dict, store_type: str):
         """
         将数据保存到JSON文件
+        文件内容始终是一个JSON数组，新数据直接覆盖原结束括号并重新闭合数组，
+        不再每条都读取、解析并重写整个文件；写入中途进程退出也不会留下缺少结束括号的文件
         
         Args:
             save_item: 要保存的数据字典
             store_type: 存储类型（contents/comments/creator）
         """
         # 创建目录
-        pathlib.Path(self.json_store_path).mkdir(parents=True, exist_ok=True)
+        ensure_store_dir(self.json_store_path)
         save_file_name = self.make_save_file_name(store_type=store_type)
-        save_data = []
-
-        # 使用锁保证线程安全
-        async with self.lock:
-            # 如果文件已存在，读取现有数据
-            if os.path.exists(save_file_name):
-                async with aiofiles.open(save_file_name, "r", encoding="utf-8") as file:
-                    content = await file.read()
-                    if content:
-                        save_data = json.loads(content)
-
-            # 添加新数据
-            save_data.append(save_item)
-            
-            # 写入文件
-            async with aiofiles.open(save_file_name, "w", encoding="utf-8") as file:
-                await file.write(json.dumps(save_data, ensure_ascii=False, indent=2))
+        # 与 json.dumps(list, indent=2) 的数组元素缩进保持一致
+        item_bytes = orjson.dumps(
+            save_item, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).replace(b"\n", b"\n  ")
+
+        # 使用文件级别的锁保证同一文件的写入不会交错（setdefault 与获取锁之间没有 await，无需额外加锁）
+        lock = DouyinJsonStoreImplement._locks.get(save_file_name)
+        if lock is None:
+            lock = DouyinJsonStoreImplement._locks.setdefault(save_file_name, asyncio.Lock())
+        async with lock:
+            # 文件以无缓冲模式打开，每次追加只有一次 write 调用，写完立即 fsync
+            # 新文件直接写入只包含当前数据的数组
+            if not os.path.exists(save_file_name) or os.path.getsize(save_file_name) == 0:
+                async with aiofiles.open(save_file_name, "wb", buffering=0) as file:
+                    await file.write(b"[\n  " + item_bytes + b"\n]")
+                    await asyncio.to_thread(os.fsync, file.fileno())
+                return
+
+            async with aiofiles.open(save_file_name, "r+b", buffering=0) as file:
+                # 只读取文件末尾，定位数组的结束括号
+                file_size = await file.seek(0, os.SEEK_END)
+                tail_size = min(file_size, JSON_TAIL_READ_SIZE)
+                await file.seek(file_size - tail_size)
+                tail = (await file.read()).rstrip()
+                if tail.endswith(b"]"):
+                    body = tail[:-1].rstrip()
+                elif tail.endswith(b"}"):
+                    # 旧版本写入时异常退出可能留下缺少结束括号的数组，补齐后继续追加
+                    utils.logger.warning(
+                        f"[DouyinJsonStoreImplement.save_data_to_json] {save_file_name} is missing the closing bracket, repairing"
+                    )
+                    body = tail
+                else:
+                    raise ValueError(
+                        f"[DouyinJsonStoreImplement.save_data_to_json] {save_file_name} is not a JSON array"
+                    )
+                # 从结束括号处直接覆盖写入新元素和新的结束括号，不先截断文件，
+                # 文件在任何时刻都以完整的数组结尾
+                await file.seek(file_size - tail_size + len(body))
+                separator = b"\n  " if body.endswith(b"[") else b",\n  "
+                await file.write(separator + item_bytes + b"\n]")
+                # 原结束括号之后若还有更多空白，写完后再截掉
+                if await file.tell() < file_size:
+                    await file.truncate()
+                await asyncio.to_thread(os.fsync, file.fileno())
 
     async def store_content(self, content_item: Dict):
         """